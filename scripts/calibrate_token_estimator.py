@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+import tiktoken
+
+from llm_price.tokens import FAST_FEATURES, _fast_features
+
+CALIBRATION_PATH = (
+    Path(__file__).resolve().parents[1] / "src" / "llm_price" / "data" / "token_calibration.json"
+)
+DEFAULT_ENCODINGS = ("cl100k_base", "o200k_base", "p50k_base")
+SAMPLE_SIZES = (200, 800, 3_000, 12_000)
+CORPUS_SUFFIXES = {".txt", ".md", ".py", ".json", ".jsonl", ".rst", ".html"}
+
+
+def _corpus_files(paths: list[Path]) -> list[tuple[str, Path]]:
+    files: list[tuple[str, Path]] = []
+    for path in paths:
+        if path.is_dir():
+            for child in sorted(path.rglob("*")):
+                if child.is_file() and child.suffix in CORPUS_SUFFIXES:
+                    files.append((path.name, child))
+        else:
+            files.append((path.name, path))
+    return files
+
+
+def _load_samples(paths: list[Path]) -> list[tuple[str, str]]:
+    """Cut every corpus file into windows of varying size, tagged by corpus path."""
+    samples: list[tuple[str, str]] = []
+    for group, path in _corpus_files(paths):
+        try:
+            text = path.read_text(encoding="utf-8")
+        except UnicodeDecodeError:
+            continue
+        start = 0
+        index = 0
+        while start < len(text):
+            size = SAMPLE_SIZES[index % len(SAMPLE_SIZES)]
+            sample = text[start : start + size]
+            if sample.strip():
+                samples.append((group, sample))
+            start += size
+            index += 1
+    return samples
+
+
+def _solve(matrix: list[list[float]], vector: list[float]) -> list[float]:
+    size = len(vector)
+    rows = [matrix[row][:] + [vector[row]] for row in range(size)]
+    for column in range(size):
+        pivot = max(range(column, size), key=lambda row: abs(rows[row][column]))
+        rows[column], rows[pivot] = rows[pivot], rows[column]
+        if rows[column][column] == 0:
+            raise ValueError(f"Corpus does not exercise feature '{FAST_FEATURES[column]}'")
+        for row in range(size):
+            if row != column:
+                factor = rows[row][column] / rows[column][column]
+                rows[row] = [a - factor * b for a, b in zip(rows[row], rows[column], strict=True)]
+    return [rows[row][size] / rows[row][row] for row in range(size)]
+
+
+def _fit(features: list[tuple[int, ...]], targets: list[int]) -> list[float]:
+    """Least squares on relative error, i.e. each sample weighted by 1 / tokens**2."""
+    width = len(FAST_FEATURES)
+    normal = [[0.0] * width for _ in range(width)]
+    rhs = [0.0] * width
+    for row, target in zip(features, targets, strict=True):
+        weight = 1.0 / (target * target)
+        for i in range(width):
+            rhs[i] += weight * row[i] * target
+            for j in range(width):
+                normal[i][j] += weight * row[i] * row[j]
+    return _solve(normal, rhs)
+
+
+def _relative_errors(
+    weights: list[float], features: list[tuple[int, ...]], targets: list[int]
+) -> list[float]:
+    errors = []
+    for row, target in zip(features, targets, strict=True):
+        total = sum(weight * value for weight, value in zip(weights, row, strict=True))
+        estimate = max(1, round(total))
+        errors.append(abs(estimate - target) / target)
+    return errors
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def _calibrate(encoding_name: str, samples: list[tuple[str, str]]) -> dict[str, Any]:
+    encoding = tiktoken.get_encoding(encoding_name)
+    texts = [text for _, text in samples]
+    targets = [len(encoding.encode(text)) for text in texts]
+    features = [_fast_features(text) for text in texts]
+    # Fit on even samples, report on held-out odd samples.
+    weights = _fit(features[::2], targets[::2])
+    held_out = list(range(1, len(samples), 2))
+    errors = _relative_errors(
+        weights, [features[i] for i in held_out], [targets[i] for i in held_out]
+    )
+
+    groups: dict[str, list[float]] = {}
+    for position, error in zip(held_out, errors, strict=True):
+        groups.setdefault(samples[position][0], []).append(error)
+
+    started = time.perf_counter()
+    for text in texts:
+        encoding.encode(text)
+    exact_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    for text in texts:
+        sum(weight * value for weight, value in zip(weights, _fast_features(text), strict=True))
+    fast_seconds = time.perf_counter() - started
+
+    return {
+        "weights": [round(weight, 6) for weight in weights],
+        "mean_abs_error": round(sum(errors) / len(errors), 4),
+        "p95_abs_error": round(_percentile(errors, 0.95), 4),
+        "samples": len(samples),
+        "report": {
+            "groups": {
+                name: {
+                    "samples": len(values),
+                    "mean_abs_error": round(sum(values) / len(values), 4),
+                    "p95_abs_error": round(_percentile(values, 0.95), 4),
+                }
+                for name, values in sorted(groups.items())
+            },
+            "chars": sum(len(text) for text in texts),
+            "exact_seconds": round(exact_seconds, 4),
+            "fast_seconds": round(fast_seconds, 4),
+        },
+    }
+
+
+def _print_report(results: dict[str, dict[str, Any]]) -> None:
+    for name, result in results.items():
+        report = result["report"]
+        speedup = report["exact_seconds"] / report["fast_seconds"]
+        print(f"## {name}")
+        print()
+        print(
+            f"{result['samples']} samples, {report['chars']} chars; "
+            f"exact {report['exact_seconds']}s, fast {report['fast_seconds']}s "
+            f"({speedup:.1f}x faster)"
+        )
+        print()
+        print("| corpus | held-out samples | mean abs error | p95 abs error |")
+        print("| --- | --- | --- | --- |")
+        for group, stats in report["groups"].items():
+            print(
+                f"| {group} | {stats['samples']} | {stats['mean_abs_error']:.1%} "
+                f"| {stats['p95_abs_error']:.1%} |"
+            )
+        print(
+            f"| **all** | {result['samples'] // 2} | {result['mean_abs_error']:.1%} "
+            f"| {result['p95_abs_error']:.1%} |"
+        )
+        print()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Fit the fast token estimator against exact tiktoken counts."
+    )
+    parser.add_argument("corpus", nargs="+", type=Path, help="corpus files or directories")
+    parser.add_argument("--encoding", action="append", dest="encodings")
+    parser.add_argument("--write", action="store_true", help=f"update {CALIBRATION_PATH.name}")
+    args = parser.parse_args()
+
+    samples = _load_samples(args.corpus)
+    if not samples:
+        raise SystemExit("Corpus is empty")
+    encodings = args.encodings or list(DEFAULT_ENCODINGS)
+    results = {name: _calibrate(name, samples) for name in encodings}
+    _print_report(results)
+
+    if args.write:
+        _write_calibrations(results)
+
+
+def _write_calibrations(results: dict[str, dict[str, Any]]) -> None:
+    """Update the fitted encodings, keeping any others already in the file."""
+    encodings: dict[str, Any] = {}
+    if CALIBRATION_PATH.exists():
+        existing = json.loads(CALIBRATION_PATH.read_text(encoding="utf-8"))
+        # Weights fitted for another feature set cannot be reused.
+        if tuple(existing.get("features", ())) == FAST_FEATURES:
+            encodings = existing["encodings"]
+    for name, result in results.items():
+        encodings[name] = {key: value for key, value in result.items() if key != "report"}
+    payload = {"features": list(FAST_FEATURES), "encodings": dict(sorted(encodings.items()))}
+    CALIBRATION_PATH.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
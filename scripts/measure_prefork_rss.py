@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import signal
+import subprocess
+import sys
+from pathlib import Path
+
+MODES = ("cold", "warmup", "warmup-shared")
+SAMPLE_PROMPT = "Summarize the attached quarterly report in three bullet points. " * 50
+
+
+def _memory_kib(pid: int) -> dict[str, int]:
+    """Rss, Pss and private (USS) memory of ``pid`` from /proc/<pid>/smaps_rollup."""
+    fields: dict[str, int] = {}
+    for line in Path(f"/proc/{pid}/smaps_rollup").read_text().splitlines()[1:]:
+        name, _, rest = line.partition(":")
+        fields[name] = int(rest.split()[0])
+    return {
+        "rss": fields["Rss"],
+        "pss": fields["Pss"],
+        "uss": fields["Private_Clean"] + fields["Private_Dirty"],
+    }
+
+
+def _handle_first_request() -> None:
+    from llm_price import cost_from_text
+
+    cost_from_text("openai", "gpt-4o-mini", prompt=SAMPLE_PROMPT)
+    cost_from_text("openai", "gpt-3.5-turbo", prompt=SAMPLE_PROMPT)
+    cost_from_text("google", "gemini-1.5-flash", prompt=SAMPLE_PROMPT)
+
+
+def _run_mode(mode: str, workers: int) -> dict[str, object]:
+    import llm_price
+
+    state = None
+    if mode != "cold":
+        state = llm_price.warmup(shared_prices=mode == "warmup-shared")
+
+    children: list[tuple[int, int]] = []
+    for _ in range(workers):
+        ready_read, ready_write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(ready_read)
+            _handle_first_request()
+            os.write(ready_write, b"1")
+            signal.pause()
+            os._exit(0)
+        os.close(ready_write)
+        children.append((pid, ready_read))
+
+    for _, ready_read in children:
+        ready = os.read(ready_read, 1)
+        os.close(ready_read)
+        if not ready:
+            raise RuntimeError("A worker exited before handling its first request")
+    samples = [_memory_kib(pid) for pid, _ in children]
+    parent = _memory_kib(os.getpid())
+    for pid, _ in children:
+        os.kill(pid, signal.SIGTERM)
+        os.waitpid(pid, 0)
+    if state is not None and state.shared_prices is not None:
+        llm_price.use_shared_prices(None)
+        state.shared_prices.close()
+        state.shared_prices.unlink()
+
+    return {
+        "mode": mode,
+        "workers": workers,
+        "worker_rss_kib": sum(item["rss"] for item in samples) // workers,
+        "worker_uss_kib": sum(item["uss"] for item in samples) // workers,
+        "total_pss_kib": parent["pss"] + sum(item["pss"] for item in samples),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare per-worker memory with and without llm_price.warmup() (Linux)."
+    )
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--mode", choices=MODES, help="run one mode in this process")
+    args = parser.parse_args()
+
+    if args.mode is not None:
+        print(json.dumps(_run_mode(args.mode, args.workers)))
+        return
+
+    print("| mode | workers | RSS per worker | USS per worker | total PSS |")
+    print("| --- | --- | --- | --- | --- |")
+    for mode in MODES:
+        # Each mode runs in a fresh interpreter so warm-up state never leaks across.
+        output = subprocess.run(
+            [sys.executable, __file__, "--mode", mode, "--workers", str(args.workers)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        result = json.loads(output)
+        print(
+            f"| {mode} | {result['workers']} "
+            f"| {result['worker_rss_kib'] / 1024:.1f} MiB "
+            f"| {result['worker_uss_kib'] / 1024:.1f} MiB "
+            f"| {result['total_pss_kib'] / 1024:.1f} MiB |"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,325 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import Any
+
+import requests
+
+ROOT = Path(__file__).resolve().parents[1]
+MODELS_PATH = ROOT / "src" / "llm_price" / "data" / "models.json"
+STATE_PATH = ROOT / "scripts" / "pricing_sync_state.json"
+OPENAI_PRICING_URL = "https://bes-dev.github.io/openai-pricing-api/pricing.json"
+OPENAI_NOTES_TEXT = "OpenAI pricing from openai-pricing-api"
+PRICING_FIELDS = ("input_per_1m", "cached_input_per_1m", "output_per_1m")
+
+Entry = dict[str, Any]
+
+
+@dataclass(frozen=True)
+class Source:
+    """A pricing feed that fully describes one provider's section of the catalogue.
+
+    ``default_notes`` is used for new models when neither the feed nor the
+    catalogue has notes for them.
+    """
+
+    provider: str
+    url: str
+    parse: Callable[[Any], list[Entry]]
+    default_notes: str | None = None
+
+
+def _normalize_pricing(value: Any, field: str, model: str) -> str:
+    if value is None:
+        raise ValueError(f"Missing {field} pricing for {model}")
+    try:
+        normalized = Decimal(str(value)).normalize()
+    except (InvalidOperation, TypeError, ValueError) as exc:
+        raise ValueError(f"Invalid {field} pricing for {model}") from exc
+    return format(normalized, "f")
+
+
+def _normalize_pricing_optional(value: Any, field: str, model: str) -> str | None:
+    if value is None:
+        return None
+    return _normalize_pricing(value, field, model)
+
+
+def parse_openai_pricing(payload: Any) -> list[Entry]:
+    """Parse the openai-pricing-api feed into catalogue entries."""
+    if not isinstance(payload, dict):
+        raise ValueError("OpenAI pricing API response must be a JSON object")
+    entries: list[Entry] = []
+    for entry in payload.values():
+        if not isinstance(entry, dict):
+            continue
+        if entry.get("pricing_type") != "per_1m_tokens":
+            continue
+        model = entry.get("model")
+        if not isinstance(model, str):
+            continue
+        entries.append(
+            {
+                "provider": "openai",
+                "model": model,
+                "release_date": None,
+                "pricing": {
+                    "input_per_1m": _normalize_pricing(entry.get("input"), "input", model),
+                    "cached_input_per_1m": _normalize_pricing_optional(
+                        entry.get("cached_input"), "cached_input", model
+                    ),
+                    "output_per_1m": _normalize_pricing(entry.get("output"), "output", model),
+                },
+                "notes": None,
+            }
+        )
+    return entries
+
+
+def catalogue_parser(provider: str) -> Callable[[Any], list[Entry]]:
+    """Parser for feeds already in models.json format, filtered to ``provider``."""
+
+    def parse(payload: Any) -> list[Entry]:
+        if not isinstance(payload, list):
+            raise ValueError(f"{provider} pricing feed must be a JSON array")
+        entries: list[Entry] = []
+        for item in payload:
+            if not isinstance(item, dict) or item.get("provider") != provider:
+                continue
+            model = item.get("model")
+            pricing = item.get("pricing")
+            if not isinstance(model, str) or not isinstance(pricing, dict):
+                raise ValueError(f"Invalid {provider} pricing entry: {item!r}")
+            entries.append(
+                {
+                    "provider": provider,
+                    "model": model,
+                    "release_date": item.get("release_date"),
+                    "pricing": {
+                        "input_per_1m": _normalize_pricing(
+                            pricing.get("input_per_1m"), "input", model
+                        ),
+                        "cached_input_per_1m": _normalize_pricing_optional(
+                            pricing.get("cached_input_per_1m"), "cached_input", model
+                        ),
+                        "output_per_1m": _normalize_pricing(
+                            pricing.get("output_per_1m"), "output", model
+                        ),
+                    },
+                    "notes": item.get("notes"),
+                }
+            )
+        return entries
+
+    return parse
+
+
+DEFAULT_SOURCES = (
+    Source("openai", OPENAI_PRICING_URL, parse_openai_pricing, OPENAI_NOTES_TEXT),
+)
+
+
+def _fetch(
+    source: Source, validators: dict[str, str], timeout_seconds: float
+) -> dict[str, Any]:
+    headers = {}
+    if "etag" in validators:
+        headers["If-None-Match"] = validators["etag"]
+    if "last_modified" in validators:
+        headers["If-Modified-Since"] = validators["last_modified"]
+    try:
+        response = requests.get(source.url, headers=headers, timeout=timeout_seconds)
+        if response.status_code == 304:
+            return {"status": "not_modified", "validators": validators}
+        response.raise_for_status()
+        entries = source.parse(response.json())
+        if not entries:
+            # Never read an empty feed as "every model was removed".
+            raise ValueError(f"{source.provider} pricing feed has no usable entries")
+    except (requests.RequestException, ValueError) as exc:
+        return {"status": "error", "error": str(exc), "validators": validators}
+    fresh: dict[str, str] = {}
+    if response.headers.get("ETag"):
+        fresh["etag"] = response.headers["ETag"]
+    if response.headers.get("Last-Modified"):
+        fresh["last_modified"] = response.headers["Last-Modified"]
+    return {"status": "fetched", "validators": fresh, "entries": entries}
+
+
+def _merge_provider(
+    models: list[Entry],
+    provider: str,
+    fetched: list[Entry],
+    default_notes: str | None = None,
+) -> list[Entry]:
+    """Replace one provider's entries.
+
+    Release dates and notes from the feed win; when the feed has none, the
+    catalogue's existing values are kept.
+    """
+    existing = {
+        item["model"].lower(): item for item in models if item.get("provider") == provider
+    }
+    merged: list[Entry] = []
+    for entry in fetched:
+        previous = existing.get(entry["model"].lower(), {})
+        merged.append(
+            {
+                **entry,
+                "release_date": entry.get("release_date") or previous.get("release_date"),
+                "notes": entry.get("notes") or previous.get("notes") or default_notes,
+            }
+        )
+    merged.sort(key=lambda item: item["model"].lower())
+
+    result: list[Entry] = []
+    inserted = False
+    for item in models:
+        if item.get("provider") != provider:
+            result.append(item)
+        elif not inserted:
+            result.extend(merged)
+            inserted = True
+    if not inserted:
+        result.extend(merged)
+    return result
+
+
+def diff_catalogues(old: list[Entry], new: list[Entry]) -> dict[str, list[Any]]:
+    """Structural diff keyed by provider and model."""
+
+    def index(models: list[Entry]) -> dict[tuple[str, str], Entry]:
+        return {(item["provider"], item["model"].lower()): item for item in models}
+
+    old_index = index(old)
+    new_index = index(new)
+    added = [
+        {"provider": key[0], "model": new_index[key]["model"]}
+        for key in new_index
+        if key not in old_index
+    ]
+    removed = [
+        {"provider": key[0], "model": old_index[key]["model"]}
+        for key in old_index
+        if key not in new_index
+    ]
+    changed = []
+    for key, after in new_index.items():
+        before = old_index.get(key)
+        if before is None:
+            continue
+        fields: dict[str, list[Any]] = {}
+        for field in ("model", "release_date", "notes"):
+            if before.get(field) != after.get(field):
+                fields[field] = [before.get(field), after.get(field)]
+        for field in PRICING_FIELDS:
+            old_value = before.get("pricing", {}).get(field)
+            new_value = after.get("pricing", {}).get(field)
+            if old_value != new_value:
+                fields[f"pricing.{field}"] = [old_value, new_value]
+        if fields:
+            changed.append({"provider": key[0], "model": after["model"], "fields": fields})
+    return {"added": added, "removed": removed, "changed": changed}
+
+
+def _write_json_atomic(path: Path, data: Any) -> None:
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(json.dumps(data, indent=2) + "\n")
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def sync(
+    sources: list[Source] | tuple[Source, ...] = DEFAULT_SOURCES,
+    *,
+    models_path: Path = MODELS_PATH,
+    state_path: Path = STATE_PATH,
+    timeout_seconds: float = 30.0,
+) -> dict[str, Any]:
+    """Fetch all sources concurrently and update the catalogue if anything changed.
+
+    Returns a change report. ``models_path`` and ``state_path`` are only rewritten
+    when their content changes.
+    """
+    models: list[Entry] = json.loads(models_path.read_text(encoding="utf-8"))
+    state: dict[str, Any] = (
+        json.loads(state_path.read_text(encoding="utf-8")) if state_path.exists() else {}
+    )
+
+    with ThreadPoolExecutor(max_workers=max(1, len(sources))) as executor:
+        results = list(
+            executor.map(
+                lambda source: _fetch(source, state.get(source.url, {}), timeout_seconds),
+                sources,
+            )
+        )
+
+    updated = models
+    new_state = dict(state)
+    report_sources: dict[str, Any] = {}
+    for source, result in zip(sources, results, strict=True):
+        report_sources[source.provider] = {"url": source.url, "status": result["status"]}
+        if result["status"] == "error":
+            report_sources[source.provider]["error"] = result["error"]
+            continue
+        new_state[source.url] = result["validators"]
+        if result["status"] == "fetched":
+            updated = _merge_provider(
+                updated, source.provider, result["entries"], source.default_notes
+            )
+
+    changes = diff_catalogues(models, updated)
+    models_changed = any(changes.values())
+    if models_changed:
+        _write_json_atomic(models_path, updated)
+    if new_state != state:
+        _write_json_atomic(state_path, new_state)
+    return {"sources": report_sources, "changes": changes, "written": models_changed}
+
+
+def _parse_source(value: str) -> Source:
+    provider, separator, url = value.partition("=")
+    if not separator or not provider or not url:
+        raise argparse.ArgumentTypeError("--source must look like PROVIDER=URL")
+    return Source(provider.lower(), url, catalogue_parser(provider.lower()))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Sync provider pricing into models.json.")
+    parser.add_argument(
+        "--source",
+        action="append",
+        type=_parse_source,
+        default=[],
+        help="extra PROVIDER=URL feed in models.json format",
+    )
+    parser.add_argument("--models", type=Path, default=MODELS_PATH)
+    parser.add_argument("--state", type=Path, default=STATE_PATH)
+    parser.add_argument("--report", type=Path, help="also write the change report here")
+    args = parser.parse_args(argv)
+
+    report = sync(
+        [*DEFAULT_SOURCES, *args.source], models_path=args.models, state_path=args.state
+    )
+    payload = json.dumps(report, indent=2)
+    if args.report is not None:
+        args.report.write_text(payload + "\n", encoding="utf-8")
+    print(payload)
+    return 1 if any(item["status"] == "error" for item in report["sources"].values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
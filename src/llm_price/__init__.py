@@ -1,30 +1,58 @@
 """Public API for llm-price."""
 
-from llm_price.currency import convert_money, get_fx_rate, get_fx_usd_to_inr
+from llm_price.budget import BudgetLedger
+from llm_price.compare import PriceIndex, RankedModel, Workload, load_workload, rank_models
+from llm_price.currency import (
+    FxSnapshot,
+    convert_money,
+    get_fx_rate,
+    get_fx_snapshot,
+    get_fx_usd_to_inr,
+)
 from llm_price.data import ModelInfo, get_model_info, list_models
+from llm_price.prefork import WarmupState, warmup
 from llm_price.pricing import (
     CostBreakdown,
+    CostSummary,
     cost_from_text,
     cost_from_tokens,
     sum_cost,
+    summarize_costs,
 )
-from llm_price.tokens import estimate_tokens
-from llm_price.types import CurrencyCode, Money, TokenPrice, TokenUsage
+from llm_price.shared_prices import SharedPriceTable, use_shared_prices
+from llm_price.tokens import count_tokens_stream, estimate_tokens
+from llm_price.types import CurrencyCode, EstimateMode, Money, TokenPrice, TokenUsage
 
 __all__ = [
+    "BudgetLedger",
     "CostBreakdown",
+    "CostSummary",
     "CurrencyCode",
+    "EstimateMode",
+    "FxSnapshot",
     "ModelInfo",
     "Money",
+    "PriceIndex",
+    "RankedModel",
+    "SharedPriceTable",
     "TokenPrice",
     "TokenUsage",
+    "WarmupState",
+    "Workload",
     "convert_money",
     "get_fx_rate",
+    "get_fx_snapshot",
     "get_fx_usd_to_inr",
     "cost_from_text",
     "cost_from_tokens",
+    "count_tokens_stream",
     "estimate_tokens",
     "get_model_info",
     "list_models",
+    "load_workload",
+    "rank_models",
     "sum_cost",
+    "summarize_costs",
+    "use_shared_prices",
+    "warmup",
 ]
\ No newline at end of file
@@ -0,0 +1,273 @@
+"""In-process spend tracking with per-key sliding-window budgets."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import Any
+
+from llm_price.pricing import CostBreakdown, cost_from_text
+from llm_price.types import CurrencyCode, EstimateMode, Money
+
+_DEFAULT_WINDOW_SECONDS = 24 * 60 * 60
+_DEFAULT_BUCKETS = 60
+_DEFAULT_STRIPES = 16
+# Stripes sweep idle keys once they hold this many windows (and then twice as many).
+_MIN_SWEEP_SIZE = 64
+
+
+class _KeyWindow:
+    """Spend for one key, bucketed so the window slides in fixed-size steps."""
+
+    __slots__ = ("buckets", "total", "limit")
+
+    def __init__(self) -> None:
+        self.buckets: deque[list[Any]] = deque()
+        self.total = Decimal("0")
+        self.limit: Decimal | None = None
+
+    def evict(self, oldest_bucket: int) -> bool:
+        """Drop buckets older than ``oldest_bucket``; return whether the window is idle."""
+        buckets = self.buckets
+        while buckets and buckets[0][0] < oldest_bucket:
+            self.total -= buckets.popleft()[1]
+        return not buckets and self.limit is None
+
+    def add(self, bucket: int, amount: Decimal) -> None:
+        buckets = self.buckets
+        if buckets and buckets[-1][0] == bucket:
+            buckets[-1][1] += amount
+        else:
+            buckets.append([bucket, amount])
+        self.total += amount
+
+
+class BudgetLedger:
+    """Thread-safe per-key spend caps over a sliding time window.
+
+    Keys are spread over ``stripes`` independent locks so concurrent charges for
+    different tenants rarely contend. The window advances in steps of
+    ``window_seconds / buckets``. Spend stays counted for at least
+    ``window_seconds`` and leaves at most one step late, so a cap is never
+    released early. Keys with no spend in the window and no custom limit are
+    dropped, so memory follows the number of active keys.
+    """
+
+    def __init__(
+        self,
+        limit: Money,
+        *,
+        window_seconds: float = _DEFAULT_WINDOW_SECONDS,
+        buckets: int = _DEFAULT_BUCKETS,
+        stripes: int = _DEFAULT_STRIPES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if window_seconds <= 0 or buckets <= 0 or stripes <= 0:
+            raise ValueError("window_seconds, buckets and stripes must be positive")
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self._bucket_count = buckets
+        self._bucket_seconds = window_seconds / buckets
+        self._clock = clock
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._windows: list[dict[str, _KeyWindow]] = [{} for _ in range(stripes)]
+        self._sweep_sizes = [_MIN_SWEEP_SIZE] * stripes
+
+    @property
+    def currency(self) -> CurrencyCode:
+        return self.limit.currency
+
+    def _stripe(self, key: str) -> int:
+        return hash(key) % len(self._locks)
+
+    def _current_bucket(self) -> int:
+        return int(self._clock() // self._bucket_seconds)
+
+    def _oldest_bucket(self, bucket: int) -> int:
+        # The current bucket is only partly elapsed, so keep one extra bucket: spend
+        # may then stay up to one step past the window but never leaves before it.
+        return bucket - self._bucket_count
+
+    def _sweep(self, stripe: int, bucket: int) -> None:
+        """Drop idle windows in ``stripe``; callers hold the stripe's lock."""
+        windows = self._windows[stripe]
+        oldest = self._oldest_bucket(bucket)
+        for key in [key for key, window in windows.items() if window.evict(oldest)]:
+            del windows[key]
+        self._sweep_sizes[stripe] = max(_MIN_SWEEP_SIZE, 2 * len(windows))
+
+    def _amount(self, cost: CostBreakdown | Money) -> Decimal:
+        money = cost.total_cost if isinstance(cost, CostBreakdown) else cost
+        if money.currency != self.limit.currency:
+            raise ValueError(
+                f"Cost currency {money.currency} does not match budget currency "
+                f"{self.limit.currency}"
+            )
+        return money.amount
+
+    def _limit_for(self, window: _KeyWindow | None) -> Decimal:
+        if window is not None and window.limit is not None:
+            return window.limit
+        return self.limit.amount
+
+    def set_limit(self, key: str, amount: Decimal | None) -> None:
+        """Override the cap for one key; ``None`` restores the default limit."""
+        stripe = self._stripe(key)
+        with self._locks[stripe]:
+            windows = self._windows[stripe]
+            window = windows.setdefault(key, _KeyWindow())
+            window.limit = amount
+            if window.evict(self._oldest_bucket(self._current_bucket())):
+                del windows[key]
+
+    def spent(self, key: str) -> Money:
+        """Return spend for ``key`` inside the current window."""
+        bucket = self._current_bucket()
+        stripe = self._stripe(key)
+        with self._locks[stripe]:
+            windows = self._windows[stripe]
+            window = windows.get(key)
+            if window is None:
+                return Money(currency=self.currency, amount=Decimal("0"))
+            if window.evict(self._oldest_bucket(bucket)):
+                del windows[key]
+            return Money(currency=self.currency, amount=window.total)
+
+    def remaining(self, key: str) -> Money:
+        """Return the unspent budget for ``key``; negative once overspent."""
+        bucket = self._current_bucket()
+        stripe = self._stripe(key)
+        with self._locks[stripe]:
+            windows = self._windows[stripe]
+            window = windows.get(key)
+            total = Decimal("0")
+            if window is not None:
+                if window.evict(self._oldest_bucket(bucket)):
+                    del windows[key]
+                total = window.total
+            return Money(currency=self.currency, amount=self._limit_for(window) - total)
+
+    def check(self, key: str, cost: CostBreakdown | Money | None = None) -> bool:
+        """Return whether ``cost`` (or nothing) still fits in ``key``'s budget."""
+        amount = self._amount(cost) if cost is not None else Decimal("0")
+        bucket = self._current_bucket()
+        stripe = self._stripe(key)
+        with self._locks[stripe]:
+            windows = self._windows[stripe]
+            window = windows.get(key)
+            if window is None:
+                return amount <= self.limit.amount
+            if window.evict(self._oldest_bucket(bucket)):
+                del windows[key]
+            return window.total + amount <= self._limit_for(window)
+
+    def charge(self, key: str, cost: CostBreakdown | Money) -> Money:
+        """Record completed spend for ``key`` and return the remaining budget.
+
+        Charges are always recorded, since the spend has already happened; the
+        remaining budget is negative once the cap is exceeded.
+        """
+        amount = self._amount(cost)
+        bucket = self._current_bucket()
+        stripe = self._stripe(key)
+        with self._locks[stripe]:
+            windows = self._windows[stripe]
+            window = windows.get(key)
+            if window is None:
+                if len(windows) >= self._sweep_sizes[stripe]:
+                    # Tenants that never come back are never evicted on access.
+                    self._sweep(stripe, bucket)
+                window = windows[key] = _KeyWindow()
+            window.evict(self._oldest_bucket(bucket))
+            window.add(bucket, amount)
+            return Money(currency=self.currency, amount=self._limit_for(window) - window.total)
+
+    def estimate(
+        self,
+        provider: str,
+        model: str,
+        *,
+        prompt: str,
+        completion: str | None = None,
+        fx_rate: Decimal | None = None,
+        estimate_mode: EstimateMode = "exact",
+    ) -> CostBreakdown:
+        """Estimate a request's cost in the budget currency before sending it."""
+        return cost_from_text(
+            provider,
+            model,
+            prompt=prompt,
+            completion=completion,
+            currency=self.currency,
+            fx_rate=fx_rate,
+            estimate_mode=estimate_mode,
+        )
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a JSON-serializable copy of every key's window."""
+        keys: dict[str, Any] = {}
+        for lock, windows in zip(self._locks, self._windows, strict=True):
+            with lock:
+                for key, window in windows.items():
+                    keys[key] = {
+                        "limit": str(window.limit) if window.limit is not None else None,
+                        "buckets": [[bucket, str(amount)] for bucket, amount in window.buckets],
+                    }
+        return {
+            "currency": self.currency,
+            "limit": str(self.limit.amount),
+            "window_seconds": self.window_seconds,
+            "buckets": self._bucket_count,
+            "keys": keys,
+        }
+
+    def save(self, path: Path) -> None:
+        """Write a snapshot to ``path`` atomically."""
+        payload = json.dumps(self.snapshot(), indent=2) + "\n"
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                handle.write(payload)
+            os.replace(tmp_name, path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+    @classmethod
+    def load(
+        cls,
+        path: Path,
+        *,
+        stripes: int = _DEFAULT_STRIPES,
+        clock: Callable[[], float] = time.time,
+    ) -> BudgetLedger:
+        """Rebuild a ledger from a snapshot written by :meth:`save`."""
+        data = json.loads(path.read_text(encoding="utf-8"))
+        try:
+            ledger = cls(
+                Money(currency=data["currency"], amount=Decimal(data["limit"])),
+                window_seconds=data["window_seconds"],
+                buckets=data["buckets"],
+                stripes=stripes,
+                clock=clock,
+            )
+            for key, item in data["keys"].items():
+                window = _KeyWindow()
+                if item["limit"] is not None:
+                    window.limit = Decimal(item["limit"])
+                for bucket, amount in item["buckets"]:
+                    window.add(int(bucket), Decimal(amount))
+                ledger._windows[ledger._stripe(key)][key] = window
+        except (InvalidOperation, KeyError, TypeError, ValueError) as exc:
+            raise ValueError(f"Invalid budget snapshot in {path}") from exc
+        return ledger
+
+
+__all__ = ["BudgetLedger"]
@@ -1,13 +1,22 @@
 from __future__ import annotations
 
 import json
+from datetime import date
 from decimal import Decimal, InvalidOperation
 from pathlib import Path
 import typer
 
+from llm_price.compare import Workload, load_workload, rank_models
+from llm_price.currency import get_fx_snapshot
 from llm_price.data import list_models
-from llm_price.pricing import Money, cost_from_text, cost_from_tokens, sum_cost
-from llm_price.types import CurrencyCode
+from llm_price.pricing import (
+    CostBreakdown,
+    Money,
+    cost_from_text,
+    cost_from_tokens,
+    summarize_costs,
+)
+from llm_price.types import CurrencyCode, EstimateMode
 
 
 app = typer.Typer(no_args_is_help=True)
@@ -29,6 +38,23 @@ def _parse_decimal(value: str | None, option_name: str) -> Decimal | None:
         raise typer.BadParameter(f"{option_name} must be a valid decimal") from exc
 
 
+def _parse_date(value: str | None, option_name: str) -> date | None:
+    if value is None:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError as exc:
+        raise typer.BadParameter(f"{option_name} must be an ISO date (YYYY-MM-DD)") from exc
+
+
+def _parse_estimate_mode(value: str) -> EstimateMode:
+    if value == "exact":
+        return "exact"
+    if value == "fast":
+        return "fast"
+    raise typer.BadParameter("--estimate-mode must be 'exact' or 'fast'")
+
+
 @app.command()
 def models(provider: str | None = typer.Option(None, "--provider")) -> None:
     items = list_models(provider)
@@ -56,9 +82,11 @@ def cost(
     completion_tokens: int | None = typer.Option(None, "--completion-tokens"),
     currency: str = typer.Option("USD", "--currency"),
     fx_rate: str | None = typer.Option(None, "--fx-rate"),
+    estimate_mode: str = typer.Option("exact", "--estimate-mode"),
 ) -> None:
     parsed_currency = _parse_currency(currency)
     parsed_fx = _parse_decimal(fx_rate, "--fx-rate")
+    parsed_mode = _parse_estimate_mode(estimate_mode)
     if prompt is None and prompt_tokens is None:
         raise typer.BadParameter("Provide --prompt or --prompt-tokens")
     if prompt_tokens is not None:
@@ -78,6 +106,7 @@ def cost(
             completion=completion,
             currency=parsed_currency,
             fx_rate=parsed_fx,
+            estimate_mode=parsed_mode,
         )
     typer.echo(
         json.dumps(
@@ -95,56 +124,134 @@ def cost(
     )
 
 
+@app.command()
+def compare(
+    prompt_tokens: int | None = typer.Option(None, "--prompt-tokens"),
+    completion_tokens: int = typer.Option(0, "--completion-tokens"),
+    cached_tokens: int = typer.Option(0, "--cached-tokens"),
+    workload: Path | None = typer.Option(None, "--workload", exists=True),
+    provider: str | None = typer.Option(None, "--provider"),
+    released_after: str | None = typer.Option(None, "--released-after"),
+    released_before: str | None = typer.Option(None, "--released-before"),
+    max_cost: str | None = typer.Option(None, "--max-cost"),
+    limit: int | None = typer.Option(None, "--limit"),
+    currency: str = typer.Option("USD", "--currency"),
+    fx_rate: str | None = typer.Option(None, "--fx-rate"),
+) -> None:
+    if workload is not None:
+        if prompt_tokens is not None or completion_tokens or cached_tokens:
+            raise typer.BadParameter("Use either --workload or token counts, not both")
+        profile = load_workload(workload)
+    elif prompt_tokens is not None:
+        profile = Workload(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            cached_tokens=cached_tokens,
+        )
+    else:
+        raise typer.BadParameter("Provide --prompt-tokens or --workload")
+    ranked = rank_models(
+        profile,
+        provider=provider,
+        released_after=_parse_date(released_after, "--released-after"),
+        released_before=_parse_date(released_before, "--released-before"),
+        max_cost=_parse_decimal(max_cost, "--max-cost"),
+        limit=limit,
+        currency=_parse_currency(currency),
+        fx_rate=_parse_decimal(fx_rate, "--fx-rate"),
+    )
+    for item in ranked:
+        typer.echo(
+            f"{item.info.provider}:{item.info.model} "
+            f"total_cost={item.total_cost.amount} currency={item.total_cost.currency}"
+        )
+
+
 @app.command()
 def sum(
     file: Path = typer.Argument(..., exists=True),
+    currency: str | None = typer.Option(None, "--currency"),
 ) -> None:
-    records = []
+    rows = []
     with file.open("r", encoding="utf-8") as handle:
         for line in handle:
             if not line.strip():
                 continue
-            data = json.loads(line)
-            if "total_cost" in data:
-                total_cost = data.get("total_cost")
-                if not isinstance(total_cost, dict):
-                    raise typer.BadParameter("total_cost must be a dict with amount/currency")
-                money = Money(
-                    currency=_parse_currency(total_cost["currency"]),
-                    amount=_parse_decimal(str(total_cost["amount"]), "total_cost.amount")
-                    or Decimal("0"),
-                )
-                records.append({"total_cost": money})
-                continue
-            if "prompt" in data or "completion" in data:
-                parsed_currency = _parse_currency(data.get("currency", "USD"))
-                breakdown = cost_from_text(
-                    data["provider"],
-                    data["model"],
-                    prompt=data.get("prompt", ""),
-                    completion=data.get("completion"),
-                    currency=parsed_currency,
-                    fx_rate=(
-                        _parse_decimal(str(data["fx_rate"]), "fx_rate")
-                        if "fx_rate" in data
-                        else None
-                    ),
-                )
-                records.append(breakdown)
-                continue
-            parsed_currency = _parse_currency(data.get("currency", "USD"))
-            breakdown = cost_from_tokens(
+            rows.append(json.loads(line))
+
+    # One FX snapshot for the whole file keeps every line on the same rates. It is
+    # only fetched for currencies that are actually converted.
+    reporting_currency = _parse_currency(currency) if currency is not None else None
+    line_currencies: set[CurrencyCode] = set()
+    record_currencies: set[CurrencyCode] = set()
+    for data in rows:
+        if "total_cost" in data:
+            if isinstance(data["total_cost"], dict) and "currency" in data["total_cost"]:
+                record_currencies.add(_parse_currency(data["total_cost"]["currency"]))
+            continue
+        parsed_currency = _parse_currency(data.get("currency", "USD"))
+        record_currencies.add(parsed_currency)
+        if "fx_rate" not in data:
+            line_currencies.add(parsed_currency)
+    if reporting_currency is None and len(record_currencies) > 1:
+        raise typer.BadParameter(
+            f"Lines use several currencies ({', '.join(sorted(record_currencies))}); "
+            "pass --currency to total them in one currency"
+        )
+    needed = set(line_currencies)
+    if reporting_currency is not None and record_currencies - {reporting_currency}:
+        needed |= record_currencies | {reporting_currency}
+    fx = get_fx_snapshot(needed) if needed - {"USD"} else None
+
+    records: list[CostBreakdown | dict[str, Money]] = []
+    for data in rows:
+        if "total_cost" in data:
+            total_cost = data.get("total_cost")
+            if not isinstance(total_cost, dict):
+                raise typer.BadParameter("total_cost must be a dict with amount/currency")
+            money = Money(
+                currency=_parse_currency(total_cost["currency"]),
+                amount=_parse_decimal(str(total_cost["amount"]), "total_cost.amount")
+                or Decimal("0"),
+            )
+            records.append({"total_cost": money})
+            continue
+        parsed_currency = _parse_currency(data.get("currency", "USD"))
+        line_fx = None
+        if "fx_rate" in data:
+            line_fx = _parse_decimal(str(data["fx_rate"]), "fx_rate")
+        elif fx is not None:
+            line_fx = fx.rate("USD", parsed_currency)
+        if "prompt" in data or "completion" in data:
+            breakdown = cost_from_text(
                 data["provider"],
                 data["model"],
-                prompt_tokens=data.get("prompt_tokens", 0),
-                completion_tokens=data.get("completion_tokens", 0),
+                prompt=data.get("prompt", ""),
+                completion=data.get("completion"),
                 currency=parsed_currency,
-                fx_rate=(
-                    _parse_decimal(str(data["fx_rate"]), "fx_rate")
-                    if "fx_rate" in data
-                    else None
-                ),
+                fx_rate=line_fx,
             )
             records.append(breakdown)
-    total = sum_cost(records)
-    typer.echo(json.dumps({"total": str(total.amount), "currency": total.currency}, indent=2))
\ No newline at end of file
+            continue
+        breakdown = cost_from_tokens(
+            data["provider"],
+            data["model"],
+            prompt_tokens=data.get("prompt_tokens", 0),
+            completion_tokens=data.get("completion_tokens", 0),
+            currency=parsed_currency,
+            fx_rate=line_fx,
+        )
+        records.append(breakdown)
+    summary = summarize_costs(records, currency=reporting_currency, fx=fx)
+    typer.echo(
+        json.dumps(
+            {
+                "total": str(summary.total.amount),
+                "currency": summary.total.currency,
+                "subtotals": {
+                    code: str(money.amount) for code, money in summary.subtotals.items()
+                },
+            },
+            indent=2,
+        )
+    )
@@ -0,0 +1,232 @@
+"""Rank catalogue models by projected cost for a token workload."""
+
+from __future__ import annotations
+
+import heapq
+import json
+from bisect import bisect_right
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+from llm_price.currency import convert_money, get_fx_rate
+from llm_price.data import ModelInfo, _price_generation, list_models
+from llm_price.tokens import estimate_tokens
+from llm_price.types import CurrencyCode, Money
+
+_ONE_MILLION = Decimal(1_000_000)
+
+
+@dataclass(frozen=True)
+class Workload:
+    prompt_tokens: int
+    completion_tokens: int
+    cached_tokens: int = 0
+
+
+@dataclass(frozen=True)
+class RankedModel:
+    info: ModelInfo
+    total_cost: Money
+
+
+@dataclass(frozen=True)
+class _IndexEntry:
+    input_per_1m: Decimal
+    cached_input_per_1m: Decimal
+    output_per_1m: Decimal
+    info: ModelInfo
+
+
+class PriceIndex:
+    """Model prices pre-sorted by input price for fast filtering and ranking."""
+
+    def __init__(self, models: Iterable[ModelInfo]) -> None:
+        entries = [
+            _IndexEntry(
+                input_per_1m=info.pricing.input_per_1m,
+                cached_input_per_1m=(
+                    info.pricing.cached_input_per_1m
+                    if info.pricing.cached_input_per_1m is not None
+                    else info.pricing.input_per_1m
+                ),
+                output_per_1m=info.pricing.output_per_1m,
+                info=info,
+            )
+            for info in models
+        ]
+        entries.sort(key=lambda entry: (entry.input_per_1m, entry.output_per_1m))
+        self._entries = entries
+        self._input_keys = [entry.input_per_1m for entry in entries]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def rank(
+        self,
+        workload: Workload,
+        *,
+        provider: str | None = None,
+        released_after: date | None = None,
+        released_before: date | None = None,
+        max_cost: Decimal | None = None,
+        limit: int | None = None,
+    ) -> list[tuple[Decimal, ModelInfo]]:
+        """Return (USD cost, model) pairs, cheapest first."""
+        _ensure_valid_workload(workload)
+        uncached = Decimal(workload.prompt_tokens - workload.cached_tokens)
+        cached = Decimal(workload.cached_tokens)
+        completion = Decimal(workload.completion_tokens)
+
+        end = len(self._entries)
+        if max_cost is not None and uncached > 0:
+            # Uncached prompt tokens alone put a floor under each model's cost, so any
+            # model whose input price already exceeds the cap can be cut by bisection.
+            end = bisect_right(self._input_keys, max_cost * _ONE_MILLION / uncached)
+
+        normalized_provider = provider.lower() if provider is not None else None
+        candidates: list[tuple[Decimal, int, ModelInfo]] = []
+        for position in range(end):
+            entry = self._entries[position]
+            info = entry.info
+            if normalized_provider is not None and info.provider != normalized_provider:
+                continue
+            if released_after is not None or released_before is not None:
+                if info.release_date is None:
+                    continue
+                if released_after is not None and info.release_date < released_after:
+                    continue
+                if released_before is not None and info.release_date > released_before:
+                    continue
+            cost = (
+                uncached * entry.input_per_1m
+                + cached * entry.cached_input_per_1m
+                + completion * entry.output_per_1m
+            ) / _ONE_MILLION
+            if max_cost is not None and cost > max_cost:
+                continue
+            candidates.append((cost, position, info))
+
+        if limit is not None:
+            ranked = heapq.nsmallest(limit, candidates)
+        else:
+            ranked = sorted(candidates)
+        return [(cost, info) for cost, _, info in ranked]
+
+
+def _ensure_valid_workload(workload: Workload) -> None:
+    if (
+        workload.prompt_tokens < 0
+        or workload.completion_tokens < 0
+        or workload.cached_tokens < 0
+    ):
+        raise ValueError("Token counts must be non-negative")
+    if workload.cached_tokens > workload.prompt_tokens:
+        raise ValueError("cached_tokens cannot exceed prompt_tokens")
+
+
+_PRICE_INDEX: tuple[tuple[int, int], PriceIndex] | None = None
+
+
+def get_price_index() -> PriceIndex:
+    """Return the shared index over the catalogue, rebuilding it whenever prices change.
+
+    Live prices from :func:`llm_price.use_shared_prices` are picked up on the next
+    call, including updates written by another process.
+    """
+    global _PRICE_INDEX
+    # Read the generation before listing models, so an update that races with the
+    # rebuild leaves a stale key and triggers another rebuild on the next call.
+    generation = _price_generation()
+    cached = _PRICE_INDEX
+    if cached is not None and cached[0] == generation:
+        return cached[1]
+    index = PriceIndex(list_models())
+    _PRICE_INDEX = (generation, index)
+    return index
+
+
+def load_workload(path: Path) -> Workload:
+    """Aggregate token counts from a usage JSONL file.
+
+    Lines with token counts are summed directly; lines with raw text are tokenized
+    with the line's provider/model. Pre-computed ``total_cost`` lines are skipped.
+    """
+    prompt_tokens = 0
+    completion_tokens = 0
+    cached_tokens = 0
+    with path.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            data = json.loads(line)
+            if "total_cost" in data:
+                continue
+            if "prompt" in data or "completion" in data:
+                usage, _ = estimate_tokens(
+                    data["provider"],
+                    data["model"],
+                    prompt=data.get("prompt", ""),
+                    completion=data.get("completion"),
+                )
+                prompt_tokens += usage.prompt_tokens
+                completion_tokens += usage.completion_tokens
+                continue
+            prompt_tokens += data.get("prompt_tokens", 0)
+            completion_tokens += data.get("completion_tokens", 0)
+            cached_tokens += data.get("cached_tokens", 0)
+    return Workload(
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        cached_tokens=cached_tokens,
+    )
+
+
+def rank_models(
+    workload: Workload,
+    *,
+    provider: str | None = None,
+    released_after: date | None = None,
+    released_before: date | None = None,
+    max_cost: Decimal | None = None,
+    limit: int | None = None,
+    currency: CurrencyCode = "USD",
+    fx_rate: Decimal | None = None,
+) -> list[RankedModel]:
+    """Rank catalogue models by projected cost for a workload, cheapest first.
+
+    ``max_cost`` is expressed in ``currency``. Models without a release date are
+    excluded whenever a release-date filter is given.
+    """
+    if currency != "USD" and fx_rate is None:
+        fx_rate = get_fx_rate("USD", currency)
+    usd_max_cost = max_cost
+    if max_cost is not None and currency != "USD" and fx_rate is not None:
+        usd_max_cost = max_cost / fx_rate
+    ranked = get_price_index().rank(
+        workload,
+        provider=provider,
+        released_after=released_after,
+        released_before=released_before,
+        max_cost=usd_max_cost,
+        limit=limit,
+    )
+    return [
+        RankedModel(
+            info=info,
+            total_cost=convert_money(Money(currency="USD", amount=cost), currency, fx_rate),
+        )
+        for cost, info in ranked
+    ]
+
+
+__all__ = [
+    "PriceIndex",
+    "RankedModel",
+    "Workload",
+    "get_price_index",
+    "load_workload",
+    "rank_models",
+]
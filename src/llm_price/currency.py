@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import time
+from collections.abc import Iterable
 from dataclasses import dataclass
 from decimal import Decimal
 from typing import Final
@@ -23,27 +24,67 @@ class FxRateCache:
     fetched_at: float
 
 
-_FX_CACHE: FxRateCache | None = None
+@dataclass(frozen=True)
+class FxSnapshot:
+    """Rates from ``base_currency`` to each currency, fetched together at one time."""
 
+    base_currency: CurrencyCode
+    rates: dict[CurrencyCode, Decimal]
+    fetched_at: float
 
-def _fetch_fx_rate(
+    def rate(self, source_currency: CurrencyCode, target_currency: CurrencyCode) -> Decimal:
+        """Return the source-to-target rate, crossing through the base currency."""
+        if source_currency == target_currency:
+            return Decimal("1")
+        try:
+            source_rate = self._base_rate(source_currency)
+            target_rate = self._base_rate(target_currency)
+        except KeyError as exc:
+            raise ValueError(f"FX snapshot has no rate for {exc.args[0]}") from exc
+        return target_rate / source_rate
+
+    def convert(self, money: Money, target_currency: CurrencyCode) -> Money:
+        return convert_money(money, target_currency, self.rate(money.currency, target_currency))
+
+    def _base_rate(self, currency: CurrencyCode) -> Decimal:
+        if currency == self.base_currency:
+            return Decimal("1")
+        return self.rates[currency]
+
+
+# One entry per currency pair, so alternating pairs do not evict each other.
+_FX_CACHE: dict[tuple[CurrencyCode, CurrencyCode], FxRateCache] = {}
+
+
+def _fetch_fx_rates(
     base_currency: CurrencyCode,
-    target_currency: CurrencyCode,
+    target_currencies: list[CurrencyCode],
     *,
     timeout_seconds: float,
-) -> Decimal:
+) -> dict[CurrencyCode, Decimal]:
     response = requests.get(
         _EXCHANGE_RATE_HOST_URL,
-        params={"base": base_currency, "symbols": target_currency},
+        params={"base": base_currency, "symbols": ",".join(target_currencies)},
         timeout=timeout_seconds,
     )
     response.raise_for_status()
     payload = response.json()
     try:
-        rate_value = payload["rates"][target_currency]
+        return {
+            currency: Decimal(str(payload["rates"][currency])) for currency in target_currencies
+        }
     except (KeyError, TypeError) as exc:
         raise ValueError("Unexpected FX response from exchangerate.host") from exc
-    return Decimal(str(rate_value))
+
+
+def _fetch_fx_rate(
+    base_currency: CurrencyCode,
+    target_currency: CurrencyCode,
+    *,
+    timeout_seconds: float,
+) -> Decimal:
+    rates = _fetch_fx_rates(base_currency, [target_currency], timeout_seconds=timeout_seconds)
+    return rates[target_currency]
 
 
 def get_fx_rate(
@@ -54,18 +95,13 @@ def get_fx_rate(
     timeout_seconds: float = _DEFAULT_TIMEOUT_SECONDS,
     use_cache: bool = True,
 ) -> Decimal:
-    global _FX_CACHE
     now = time.time()
-    if use_cache and _FX_CACHE is not None:
-        if (
-            _FX_CACHE.base_currency == base_currency
-            and _FX_CACHE.target_currency == target_currency
-            and now - _FX_CACHE.fetched_at < cache_ttl_seconds
-        ):
-            return _FX_CACHE.rate
+    cached = _FX_CACHE.get((base_currency, target_currency))
+    if use_cache and cached is not None and now - cached.fetched_at < cache_ttl_seconds:
+        return cached.rate
 
     rate = _fetch_fx_rate(base_currency, target_currency, timeout_seconds=timeout_seconds)
-    _FX_CACHE = FxRateCache(
+    _FX_CACHE[(base_currency, target_currency)] = FxRateCache(
         base_currency=base_currency,
         target_currency=target_currency,
         rate=rate,
@@ -74,6 +110,31 @@ def get_fx_rate(
     return rate
 
 
+def prime_fx_cache(snapshot: FxSnapshot) -> None:
+    """Seed the get_fx_rate cache with every base-currency rate in ``snapshot``."""
+    for target_currency, rate in snapshot.rates.items():
+        _FX_CACHE[(snapshot.base_currency, target_currency)] = FxRateCache(
+            base_currency=snapshot.base_currency,
+            target_currency=target_currency,
+            rate=rate,
+            fetched_at=snapshot.fetched_at,
+        )
+
+
+def get_fx_snapshot(
+    currencies: Iterable[CurrencyCode],
+    *,
+    base_currency: CurrencyCode = "USD",
+    timeout_seconds: float = _DEFAULT_TIMEOUT_SECONDS,
+) -> FxSnapshot:
+    """Fetch rates for every currency in a single request."""
+    targets = sorted({currency for currency in currencies if currency != base_currency})
+    rates: dict[CurrencyCode, Decimal] = {}
+    if targets:
+        rates = _fetch_fx_rates(base_currency, targets, timeout_seconds=timeout_seconds)
+    return FxSnapshot(base_currency=base_currency, rates=rates, fetched_at=time.time())
+
+
 def get_fx_usd_to_inr(
     *,
     cache_ttl_seconds: int = _DEFAULT_CACHE_TTL_SECONDS,
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, replace
 from datetime import date
 from decimal import Decimal
 from importlib import resources
@@ -52,23 +53,57 @@ def _load_models() -> list[ModelInfo]:
     return models
 
 
+def _index_models(models: list[ModelInfo]) -> dict[tuple[str, str], int]:
+    positions: dict[tuple[str, str], int] = {}
+    for position, info in enumerate(models):
+        positions.setdefault((info.provider, info.model.lower()), position)
+    return positions
+
+
 _MODELS = _load_models()
+_MODEL_POSITIONS = _index_models(_MODELS)
+# Reads live pricing by catalogue position; set by llm_price.shared_prices.
+_PRICE_SOURCE: Callable[[int], TokenPrice] | None = None
+# Returns a counter that changes whenever the live prices change.
+_PRICE_VERSION: Callable[[], int] | None = None
+_PRICE_SOURCE_CHANGES = 0
+
+
+def _set_price_source(
+    source: Callable[[int], TokenPrice] | None, version: Callable[[], int] | None = None
+) -> None:
+    global _PRICE_SOURCE, _PRICE_VERSION, _PRICE_SOURCE_CHANGES
+    _PRICE_SOURCE = source
+    _PRICE_VERSION = version
+    _PRICE_SOURCE_CHANGES += 1
+
+
+def _price_generation() -> tuple[int, int]:
+    """Token that differs whenever list_models/get_model_info may return new prices."""
+    version = _PRICE_VERSION() if _PRICE_VERSION is not None else 0
+    return _PRICE_SOURCE_CHANGES, version
+
+
+def _with_price_source(position: int, info: ModelInfo) -> ModelInfo:
+    if _PRICE_SOURCE is None:
+        return info
+    return replace(info, pricing=_PRICE_SOURCE(position))
 
 
 def list_models(provider: str | None = None) -> list[ModelInfo]:
-    if provider is None:
-        return list(_MODELS)
-    normalized = provider.lower()
-    return [model for model in _MODELS if model.provider == normalized]
+    normalized = provider.lower() if provider is not None else None
+    return [
+        _with_price_source(position, info)
+        for position, info in enumerate(_MODELS)
+        if normalized is None or info.provider == normalized
+    ]
 
 
 def get_model_info(provider: str, model: str) -> ModelInfo:
-    normalized_provider = provider.lower()
-    normalized_model = model.lower()
-    for info in _MODELS:
-        if info.provider == normalized_provider and info.model.lower() == normalized_model:
-            return info
-    raise ValueError(f"Unknown model '{model}' for provider '{provider}'")
+    position = _MODEL_POSITIONS.get((provider.lower(), model.lower()))
+    if position is None:
+        raise ValueError(f"Unknown model '{model}' for provider '{provider}'")
+    return _with_price_source(position, _MODELS[position])
 
 
 __all__ = ["ModelInfo", "get_model_info", "list_models"]
\ No newline at end of file
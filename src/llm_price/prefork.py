@@ -0,0 +1,69 @@
+"""Warm-up for pre-fork worker servers."""
+
+from __future__ import annotations
+
+import gc
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+import tiktoken
+
+from llm_price.compare import get_price_index
+from llm_price.currency import FxSnapshot, get_fx_snapshot, prime_fx_cache
+from llm_price.data import list_models
+from llm_price.shared_prices import SharedPriceTable, use_shared_prices
+from llm_price.tokens import _load_calibrations, _openai_encoding_name
+from llm_price.types import CurrencyCode
+
+
+@dataclass(frozen=True)
+class WarmupState:
+    encodings: tuple[str, ...]
+    fx: FxSnapshot | None
+    shared_prices: SharedPriceTable | None
+
+
+def warmup(
+    models: Iterable[str] | None = None,
+    *,
+    currencies: Iterable[CurrencyCode] = (),
+    shared_prices: bool = False,
+    freeze: bool = True,
+) -> WarmupState:
+    """Load everything workers need before the server forks.
+
+    Resolves tiktoken encoders for the given OpenAI model names (all catalogue
+    models by default, plus ``cl100k_base`` for Gemini approximations), builds the
+    price index, and primes the FX cache for ``currencies`` with a single request.
+    With ``shared_prices`` the price table is moved to shared memory; the caller
+    owns it and should ``unlink()`` it at shutdown. With ``freeze`` the loaded
+    objects are moved out of the garbage collector's reach, so collections in
+    workers do not write to, and un-share, their pages.
+    """
+    if models is None:
+        models = [info.model for info in list_models("openai")]
+    names = sorted({"cl100k_base", *(_openai_encoding_name(model) for model in models)})
+    for name in names:
+        tiktoken.get_encoding(name)
+    _load_calibrations()
+
+    targets = list(currencies)
+    fx = None
+    if targets:
+        fx = get_fx_snapshot(targets)
+        prime_fx_cache(fx)
+
+    table = None
+    if shared_prices:
+        table = SharedPriceTable.create()
+        use_shared_prices(table)
+    # Built after the price source is chosen, so workers inherit an up-to-date index.
+    get_price_index()
+
+    if freeze:
+        gc.collect()
+        gc.freeze()
+    return WarmupState(encodings=tuple(names), fx=fx, shared_prices=table)
+
+
+__all__ = ["WarmupState", "warmup"]
@@ -4,10 +4,10 @@ from dataclasses import dataclass
 from decimal import Decimal
 from typing import Iterable
 
-from llm_price.currency import convert_money, get_fx_rate
+from llm_price.currency import FxSnapshot, convert_money, get_fx_rate, get_fx_snapshot
 from llm_price.data import get_model_info
 from llm_price.tokens import estimate_tokens
-from llm_price.types import CurrencyCode, Money, TokenPrice, TokenUsage
+from llm_price.types import CurrencyCode, EstimateMode, Money, TokenPrice, TokenUsage
 
 
 @dataclass(frozen=True)
@@ -19,6 +19,13 @@ class CostBreakdown:
     notes: str | None = None
 
 
+@dataclass(frozen=True)
+class CostSummary:
+    total: Money
+    subtotals: dict[CurrencyCode, Money]
+    fx: FxSnapshot | None = None
+
+
 def _calc_cost(amount: Decimal, currency: CurrencyCode) -> Money:
     return Money(currency=currency, amount=amount)
 
@@ -74,11 +81,14 @@ def cost_from_text(
     completion: str | None = None,
     currency: CurrencyCode = "USD",
     fx_rate: Decimal | None = None,
+    estimate_mode: EstimateMode = "exact",
 ) -> CostBreakdown:
     """Compute cost from prompt/completion text by estimating tokens."""
     if currency != "USD" and fx_rate is None:
         fx_rate = get_fx_rate("USD", currency)
-    usage, note = estimate_tokens(provider, model, prompt=prompt, completion=completion)
+    usage, note = estimate_tokens(
+        provider, model, prompt=prompt, completion=completion, estimate_mode=estimate_mode
+    )
     breakdown = cost_from_tokens(
         provider,
         model,
@@ -98,27 +108,62 @@ def cost_from_text(
     return breakdown
 
 
-def sum_cost(records: Iterable[CostBreakdown | dict]) -> Money:
-    """Sum total costs from CostBreakdown objects or dicts with 'total_cost'."""
-    total = Decimal("0")
-    currency: CurrencyCode | None = None
+def _record_total(record: CostBreakdown | dict[str, Money]) -> Money:
+    if isinstance(record, CostBreakdown):
+        return record.total_cost
+    total_cost = record.get("total_cost")
+    if not isinstance(total_cost, Money):
+        raise ValueError("Record must contain total_cost Money")
+    return total_cost
+
+
+def summarize_costs(
+    records: Iterable[CostBreakdown | dict[str, Money]],
+    *,
+    currency: CurrencyCode | None = None,
+    fx: FxSnapshot | None = None,
+) -> CostSummary:
+    """Total costs per native currency, then convert once into ``currency``.
+
+    Without ``currency`` all records must share one currency. When conversion is
+    needed and no ``fx`` snapshot is given, every rate is fetched in one request.
+    """
+    subtotals: dict[CurrencyCode, Decimal] = {}
     for record in records:
-        if isinstance(record, CostBreakdown):
-            amount = record.total_cost.amount
-            record_currency = record.total_cost.currency
-        else:
-            total_cost = record.get("total_cost")
-            if not isinstance(total_cost, Money):
-                raise ValueError("Record must contain total_cost Money")
-            amount = total_cost.amount
-            record_currency = total_cost.currency
-
-        if currency is None:
-            currency = record_currency
-        if record_currency != currency:
-            raise ValueError("All records must use the same currency")
-        total += amount
+        money = _record_total(record)
+        subtotals[money.currency] = subtotals.get(money.currency, Decimal("0")) + money.amount
 
-    if currency is None:
+    if not subtotals:
         raise ValueError("No records provided")
-    return Money(currency=currency, amount=total)
\ No newline at end of file
+    if currency is None:
+        if len(subtotals) > 1:
+            raise ValueError("All records must use the same currency; pass currency= to convert")
+        currency = next(iter(subtotals))
+
+    money_subtotals = {
+        code: Money(currency=code, amount=amount) for code, amount in subtotals.items()
+    }
+    total = subtotals.get(currency, Decimal("0"))
+    foreign = [money for money in money_subtotals.values() if money.currency != currency]
+    if foreign:
+        if fx is None:
+            fx = get_fx_snapshot([*subtotals, currency])
+        for money in foreign:
+            total += fx.convert(money, currency).amount
+    return CostSummary(
+        total=Money(currency=currency, amount=total), subtotals=money_subtotals, fx=fx
+    )
+
+
+def sum_cost(
+    records: Iterable[CostBreakdown | dict[str, Money]],
+    *,
+    currency: CurrencyCode | None = None,
+    fx: FxSnapshot | None = None,
+) -> Money:
+    """Sum total costs from CostBreakdown objects or dicts with 'total_cost'.
+
+    Records may mix currencies when a reporting ``currency`` is given; see
+    :func:`summarize_costs`.
+    """
+    return summarize_costs(records, currency=currency, fx=fx).total
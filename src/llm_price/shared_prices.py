@@ -0,0 +1,134 @@
+"""Catalogue prices in shared memory, for pre-fork worker servers."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from multiprocessing import shared_memory
+
+from llm_price import data
+from llm_price.types import TokenPrice
+
+# Prices are stored as int64 nano-USD per 1M tokens; -1 marks a missing price.
+_SCALE = Decimal(10**9)
+_MISSING = -1
+# Header: model count, then a version counter that is odd while a write is in progress.
+_HEADER_SLOTS = 2
+_SLOTS_PER_MODEL = 3
+_SLOT_BYTES = 8
+
+
+def _encode(value: Decimal | None) -> int:
+    if value is None:
+        return _MISSING
+    scaled = value * _SCALE
+    if scaled != scaled.to_integral_value() or scaled < 0:
+        raise ValueError(f"Price {value} cannot be stored with nano-USD precision")
+    return int(scaled)
+
+
+def _decode(value: int) -> Decimal | None:
+    if value == _MISSING:
+        return None
+    return Decimal(value) / _SCALE
+
+
+class SharedPriceTable:
+    """Token prices for every catalogue model in one shared-memory buffer.
+
+    Create the table in the parent before forking; children inherit the mapping,
+    and processes started any other way can :meth:`attach` by name. Rows follow
+    the bundled catalogue order. Updates are meant to come from a single writer
+    and are published with a sequence counter, so readers never see half a row.
+    """
+
+    def __init__(self, memory: shared_memory.SharedMemory) -> None:
+        if memory.buf is None:
+            raise ValueError("Shared memory buffer is closed")
+        self._memory = memory
+        self._slots = memory.buf.cast("q")
+
+    @classmethod
+    def create(cls) -> SharedPriceTable:
+        models = data._MODELS
+        size = (_HEADER_SLOTS + _SLOTS_PER_MODEL * len(models)) * _SLOT_BYTES
+        table = cls(shared_memory.SharedMemory(create=True, size=size))
+        table._slots[0] = len(models)
+        table._slots[1] = 0
+        for position, info in enumerate(models):
+            table._write_row(position, info.pricing)
+        return table
+
+    @classmethod
+    def attach(cls, name: str) -> SharedPriceTable:
+        table = cls(shared_memory.SharedMemory(name=name))
+        if table._slots[0] != len(data._MODELS):
+            table.close()
+            raise ValueError("Shared price table does not match the bundled catalogue")
+        return table
+
+    @property
+    def name(self) -> str:
+        return self._memory.name
+
+    def __len__(self) -> int:
+        return int(self._slots[0])
+
+    @property
+    def version(self) -> int:
+        """Counter bumped by every :meth:`update`, in this and all attached processes."""
+        return int(self._slots[1])
+
+    def _write_row(self, position: int, price: TokenPrice) -> None:
+        base = _HEADER_SLOTS + position * _SLOTS_PER_MODEL
+        self._slots[base] = _encode(price.input_per_1m)
+        self._slots[base + 1] = _encode(price.cached_input_per_1m)
+        self._slots[base + 2] = _encode(price.output_per_1m)
+
+    def pricing(self, position: int) -> TokenPrice:
+        if not 0 <= position < len(self):
+            raise IndexError(position)
+        base = _HEADER_SLOTS + position * _SLOTS_PER_MODEL
+        slots = self._slots
+        while True:
+            version = slots[1]
+            row = slots[base], slots[base + 1], slots[base + 2]
+            if version % 2 == 0 and slots[1] == version:
+                break
+        input_price, cached_price, output_price = (_decode(value) for value in row)
+        if input_price is None or output_price is None:
+            raise ValueError(f"Shared price table row {position} is incomplete")
+        return TokenPrice(
+            input_per_1m=input_price,
+            cached_input_per_1m=cached_price,
+            output_per_1m=output_price,
+        )
+
+    def update(self, provider: str, model: str, price: TokenPrice) -> None:
+        """Change one model's prices; every attached process sees it immediately."""
+        position = data._MODEL_POSITIONS.get((provider.lower(), model.lower()))
+        if position is None:
+            raise ValueError(f"Unknown model '{model}' for provider '{provider}'")
+        self._slots[1] += 1
+        try:
+            self._write_row(position, price)
+        finally:
+            self._slots[1] += 1
+
+    def close(self) -> None:
+        self._slots.release()
+        self._memory.close()
+
+    def unlink(self) -> None:
+        """Free the buffer; call once, from the creating process, at shutdown."""
+        self._memory.unlink()
+
+
+def use_shared_prices(table: SharedPriceTable | None) -> None:
+    """Serve get_model_info/list_models prices from ``table`` (``None`` to stop)."""
+    if table is None:
+        data._set_price_source(None)
+    else:
+        data._set_price_source(table.pricing, lambda: table.version)
+
+
+__all__ = ["SharedPriceTable", "use_shared_prices"]
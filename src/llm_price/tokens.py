@@ -1,24 +1,298 @@
 from __future__ import annotations
 
+import json
 import os
+import unicodedata
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from importlib import resources
+from typing import TextIO
 
 import requests
 import tiktoken
 
-from llm_price.types import TokenUsage
+from llm_price.types import EstimateMode, TokenUsage
 
+# Texts longer than this are counted chunk by chunk instead of in one encode call.
+_STREAM_THRESHOLD_CHARS = 1_000_000
+_STREAM_CHUNK_CHARS = 256 * 1024
+# Without a safe boundary the buffer may grow to this many chunks before a forced cut.
+_STREAM_MAX_BUFFER_CHUNKS = 4
+# How far back a forced cut looks for a letter/digit followed by punctuation.
+_FORCED_CUT_LOOKBACK = 1024
+# Largest count error seen per forced cut on cl100k/o200k/p50k (CJK, JSON, base64).
+_FORCED_CUT_MAX_ERROR = 2
 
-def _openai_tokenize(text: str, model: str) -> int:
+
+def _openai_encoding(model: str) -> tiktoken.Encoding:
     try:
-        encoding = tiktoken.encoding_for_model(model)
+        return tiktoken.encoding_for_model(model)
     except KeyError:
-        encoding = tiktoken.get_encoding("cl100k_base")
-    return len(encoding.encode(text))
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def _count(encoding: tiktoken.Encoding, text: str) -> tuple[int, int]:
+    """Return (tokens, forced chunk cuts) for ``text``."""
+    if len(text) > _STREAM_THRESHOLD_CHARS:
+        return _count_stream(text, encoding, _STREAM_CHUNK_CHARS, None)
+    return len(encoding.encode(text)), 0
+
+
+def _openai_tokenize(text: str, model: str) -> tuple[int, int]:
+    return _count(_openai_encoding(model), text)
+
+
+def _approximate_tokens(text: str) -> tuple[int, int]:
+    return _count(tiktoken.get_encoding("cl100k_base"), text)
+
+
+def _forced_cuts_note(forced_cuts: int) -> str | None:
+    if not forced_cuts:
+        return None
+    return (
+        f"Long text without whitespace was split at {forced_cuts} forced chunk "
+        f"boundaries; token counts may be off by up to ±{forced_cuts * _FORCED_CUT_MAX_ERROR}"
+    )
+
+
+def _split_point(text: str, lower: int) -> int:
+    """Return the last index at or after ``lower`` where ``text`` can be cut, or -1.
+
+    Cuts go after a single newline between two non-space characters, or else
+    before a space between an alphanumeric character and a letter. Every tiktoken
+    pre-tokenizer pattern ends a piece at those positions, and BPE never merges
+    across pieces, so the two halves encode to exactly the tokens of the whole.
+    """
+    index = text.rfind("\n", lower, len(text) - 1)
+    while index > 0:
+        if not text[index - 1].isspace() and not text[index + 1].isspace():
+            return index + 1
+        index = text.rfind("\n", lower, index)
+    index = text.rfind(" ", lower, len(text) - 1)
+    while index > 0:
+        if text[index - 1].isalnum() and text[index + 1].isalpha():
+            return index
+        index = text.rfind(" ", lower, index)
+    return -1
+
+
+def _is_mark(char: str) -> bool:
+    # Covers spacing and non-spacing marks, e.g. Thai and Indic vowel signs, which
+    # unicodedata.combining() reports as 0.
+    return unicodedata.category(char).startswith("M")
+
+
+def _forced_split_point(text: str, upper: int) -> int:
+    """Return a cut near ``upper`` for text that has no safe boundary.
+
+    Prefers a letter or digit followed by punctuation, where pieces end in practice
+    (minified JSON, CJK prose with full-width punctuation), and otherwise cuts at
+    ``upper``. Neither cut separates a mark from its base character.
+    """
+    lower = max(1, upper - _FORCED_CUT_LOOKBACK)
+    for index in range(upper, lower - 1, -1):
+        char = text[index]
+        if text[index - 1].isalnum() and not (
+            char.isalnum() or char.isspace() or char == "'" or _is_mark(char)
+        ):
+            return index
+    index = upper
+    while index > 1 and _is_mark(text[index]):
+        index -= 1
+    return index
+
+
+def _read_pieces(source: str | TextIO | Iterable[str], chunk_chars: int) -> Iterator[str]:
+    if isinstance(source, str):
+        for start in range(0, len(source), chunk_chars):
+            yield source[start : start + chunk_chars]
+        return
+    read = getattr(source, "read", None)
+    if read is not None:
+        while piece := read(chunk_chars):
+            yield piece
+        return
+    yield from source
+
+
+def _safe_chunks(
+    pieces: Iterator[str], chunk_chars: int, forced_cuts: list[int]
+) -> Iterator[str]:
+    """Re-cut ``pieces`` into chunks, counting forced cuts in ``forced_cuts[0]``."""
+    max_buffer = _STREAM_MAX_BUFFER_CHUNKS * chunk_chars
+    buffer = ""
+    for piece in pieces:
+        buffer += piece
+        while len(buffer) >= chunk_chars:
+            cut = _split_point(buffer, chunk_chars // 2)
+            if cut <= 0:
+                if len(buffer) < max_buffer:
+                    # No safe boundary yet: keep buffering until one arrives.
+                    break
+                cut = _forced_split_point(buffer, chunk_chars)
+                forced_cuts[0] += 1
+            yield buffer[:cut]
+            buffer = buffer[cut:]
+    if buffer:
+        yield buffer
+
+
+def count_tokens_stream(
+    source: str | TextIO | Iterable[str],
+    model: str = "gpt-4o",
+    *,
+    encoding: tiktoken.Encoding | None = None,
+    chunk_chars: int = _STREAM_CHUNK_CHARS,
+    max_workers: int | None = None,
+) -> int:
+    """Count tokens in a long text without materializing its full token list.
+
+    ``source`` may be a string, a text file object or an iterable of string
+    chunks. Input is re-cut at pre-tokenizer boundaries, so the result equals
+    ``len(encoding.encode(text))`` for the joined text. Chunks are encoded on a
+    thread pool with at most ``2 * max_workers`` chunks in flight.
+
+    Text with no such boundary for ``4 * chunk_chars`` characters (CJK without
+    spaces, minified JSON, base64) is cut anyway to bound memory. Each forced cut
+    can change the count by a couple of tokens; at most 2 was observed.
+    """
+    if chunk_chars <= 1:
+        raise ValueError("chunk_chars must be greater than 1")
+    encoder = encoding if encoding is not None else _openai_encoding(model)
+    return _count_stream(source, encoder, chunk_chars, max_workers)[0]
+
+
+def _count_stream(
+    source: str | TextIO | Iterable[str],
+    encoder: tiktoken.Encoding,
+    chunk_chars: int,
+    max_workers: int | None,
+) -> tuple[int, int]:
+    def count_chunk(chunk: str) -> int:
+        return len(encoder.encode(chunk))
+
+    forced_cuts = [0]
+    chunks = _safe_chunks(_read_pieces(source, chunk_chars), chunk_chars, forced_cuts)
+    workers = max_workers or os.cpu_count() or 1
+    if workers == 1:
+        return sum(count_chunk(chunk) for chunk in chunks), forced_cuts[0]
 
+    total = 0
+    pending: deque[Future[int]] = deque()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for chunk in chunks:
+            if len(pending) >= 2 * workers:
+                total += pending.popleft().result()
+            pending.append(executor.submit(count_chunk, chunk))
+        while pending:
+            total += pending.popleft().result()
+    return total, forced_cuts[0]
 
-def _approximate_tokens(text: str) -> int:
-    encoding = tiktoken.get_encoding("cl100k_base")
-    return len(encoding.encode(text))
+
+# Order of the features returned by _fast_features and of calibration weights.
+FAST_FEATURES = ("chars", "non_ascii_bytes", "spaces", "newlines", "punctuation", "digits")
+
+
+def _build_class_table() -> bytes:
+    table = bytearray(b"p" * 256)
+    for value in range(256):
+        char = chr(value)
+        if value >= 0x80 or char.isalpha():
+            table[value] = ord("a")
+        elif char.isdigit():
+            table[value] = ord("d")
+        elif char == "\n":
+            table[value] = ord("n")
+        elif char.isspace():
+            table[value] = ord("s")
+    return bytes(table)
+
+
+_CLASS_TABLE = _build_class_table()
+
+
+@dataclass(frozen=True)
+class TokenCalibration:
+    encoding: str
+    weights: tuple[float, ...]
+    mean_abs_error: float
+    p95_abs_error: float
+    samples: int
+
+
+def _fast_features(text: str) -> tuple[int, ...]:
+    """Character-class counts used by the fast estimator, in FAST_FEATURES order."""
+    data = text.encode("utf-8")
+    classes = data.translate(_CLASS_TABLE)
+    return (
+        len(text),
+        len(data) - len(text),
+        classes.count(b"s"),
+        classes.count(b"n"),
+        classes.count(b"p"),
+        classes.count(b"d"),
+    )
+
+
+@lru_cache(maxsize=1)
+def _load_calibrations() -> dict[str, TokenCalibration]:
+    raw = json.loads(
+        resources.files("llm_price.data").joinpath("token_calibration.json").read_text()
+    )
+    if tuple(raw["features"]) != FAST_FEATURES or any(
+        len(item["weights"]) != len(FAST_FEATURES) for item in raw["encodings"].values()
+    ):
+        raise ValueError("token_calibration.json features do not match this version")
+    return {
+        name: TokenCalibration(
+            encoding=name,
+            weights=tuple(float(weight) for weight in item["weights"]),
+            mean_abs_error=float(item["mean_abs_error"]),
+            p95_abs_error=float(item["p95_abs_error"]),
+            samples=int(item["samples"]),
+        )
+        for name, item in raw["encodings"].items()
+    }
+
+
+def _calibration_for(encoding_name: str) -> TokenCalibration:
+    calibrations = _load_calibrations()
+    return calibrations.get(encoding_name, calibrations["cl100k_base"])
+
+
+def _fast_count(text: str, calibration: TokenCalibration) -> int:
+    if not text:
+        return 0
+    estimate = sum(
+        weight * value
+        for weight, value in zip(calibration.weights, _fast_features(text), strict=True)
+    )
+    return max(1, round(estimate))
+
+
+def _fast_estimate(
+    encoding_name: str, prompt: str, completion: str | None
+) -> tuple[TokenUsage, str]:
+    calibration = _calibration_for(encoding_name)
+    usage = TokenUsage(
+        prompt_tokens=_fast_count(prompt, calibration),
+        completion_tokens=_fast_count(completion or "", calibration),
+    )
+    return usage, (
+        f"Fast token estimate ({calibration.encoding} heuristic); expected error "
+        f"±{calibration.mean_abs_error:.0%} mean, ±{calibration.p95_abs_error:.0%} p95"
+    )
+
+
+@lru_cache(maxsize=256)
+def _openai_encoding_name(model: str) -> str:
+    try:
+        return tiktoken.model.encoding_name_for_model(model)
+    except KeyError:
+        return "cl100k_base"
 
 
 def _gemini_count_tokens_api(model: str, prompt: str, completion: str | None) -> int | None:
@@ -44,12 +318,30 @@ def estimate_tokens(
     *,
     prompt: str,
     completion: str | None = None,
+    estimate_mode: EstimateMode = "exact",
 ) -> tuple[TokenUsage, str | None]:
+    """Estimate prompt/completion tokens for a model.
+
+    ``estimate_mode="fast"`` skips tokenizers and the Gemini API and uses a
+    character-class heuristic calibrated per encoding; the returned note states
+    its expected error.
+    """
     normalized = provider.lower()
+    if estimate_mode not in ("exact", "fast"):
+        raise ValueError(f"Unsupported estimate_mode '{estimate_mode}'")
+    if estimate_mode == "fast":
+        if normalized == "openai":
+            return _fast_estimate(_openai_encoding_name(model), prompt, completion)
+        if normalized == "google":
+            return _fast_estimate("cl100k_base", prompt, completion)
+        raise ValueError(f"Unsupported provider '{provider}'")
     if normalized == "openai":
-        prompt_tokens = _openai_tokenize(prompt, model)
-        completion_tokens = _openai_tokenize(completion or "", model)
-        return TokenUsage(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens), None
+        prompt_tokens, prompt_cuts = _openai_tokenize(prompt, model)
+        completion_tokens, completion_cuts = _openai_tokenize(completion or "", model)
+        return (
+            TokenUsage(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens),
+            _forced_cuts_note(prompt_cuts + completion_cuts),
+        )
     if normalized == "google":
         total_tokens = _gemini_count_tokens_api(model, prompt, completion)
         if total_tokens is not None:
@@ -57,8 +349,8 @@ def estimate_tokens(
                 TokenUsage(prompt_tokens=total_tokens, completion_tokens=0),
                 "Gemini CountTokens API returns total tokens; completion split not available",
             )
-        prompt_tokens = _approximate_tokens(prompt)
-        completion_tokens = _approximate_tokens(completion or "")
+        prompt_tokens, _ = _approximate_tokens(prompt)
+        completion_tokens, _ = _approximate_tokens(completion or "")
         return (
             TokenUsage(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens),
             "Token counts are approximate; set GOOGLE_API_KEY for official Gemini CountTokens",
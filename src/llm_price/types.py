@@ -2,8 +2,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from decimal import Decimal
+from typing import Literal
 
 CurrencyCode = str
+EstimateMode = Literal["exact", "fast"]
 
 
 @dataclass(frozen=True)
@@ -0,0 +1,115 @@
+from decimal import Decimal
+from pathlib import Path
+from threading import Thread
+
+import pytest
+
+from llm_price.budget import BudgetLedger
+from llm_price.pricing import cost_from_tokens
+from llm_price.types import Money
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_charge_and_check() -> None:
+    ledger = BudgetLedger(Money(currency="USD", amount=Decimal("1")))
+    breakdown = cost_from_tokens(
+        "openai", "gpt-4o-mini", prompt_tokens=1_000_000, completion_tokens=0
+    )
+    remaining = ledger.charge("tenant-a", breakdown)
+    assert remaining.amount == Decimal("1") - breakdown.total_cost.amount
+    assert ledger.spent("tenant-a") == breakdown.total_cost
+    assert ledger.check("tenant-a", Money(currency="USD", amount=remaining.amount))
+    assert not ledger.check("tenant-a", Money(currency="USD", amount=Decimal("1")))
+    assert ledger.spent("tenant-b").amount == Decimal("0")
+    with pytest.raises(ValueError):
+        ledger.charge("tenant-a", Money(currency="INR", amount=Decimal("1")))
+
+
+def test_window_slides() -> None:
+    clock = _Clock()
+    ledger = BudgetLedger(
+        Money(currency="USD", amount=Decimal("10")), window_seconds=60, buckets=6, clock=clock
+    )
+    ledger.set_limit("tenant-a", Decimal("2"))
+    ledger.charge("tenant-a", Money(currency="USD", amount=Decimal("1.5")))
+    clock.now += 30
+    ledger.charge("tenant-a", Money(currency="USD", amount=Decimal("1")))
+    assert not ledger.check("tenant-a")
+    clock.now += 40
+    assert ledger.spent("tenant-a").amount == Decimal("1")
+    assert ledger.remaining("tenant-a").amount == Decimal("1")
+
+
+def test_spend_never_leaves_the_window_early() -> None:
+    clock = _Clock()
+    ledger = BudgetLedger(
+        Money(currency="USD", amount=Decimal("1")), window_seconds=60, buckets=6, clock=clock
+    )
+    clock.now = 1_009.9
+    ledger.charge("tenant-a", Money(currency="USD", amount=Decimal("1")))
+    clock.now = 1_069.9
+    assert ledger.spent("tenant-a").amount == Decimal("1")
+    assert not ledger.check("tenant-a", Money(currency="USD", amount=Decimal("1")))
+    clock.now = 1_070.0
+    assert ledger.spent("tenant-a").amount == Decimal("0")
+    assert ledger.check("tenant-a", Money(currency="USD", amount=Decimal("1")))
+
+
+def test_idle_keys_are_dropped() -> None:
+    clock = _Clock()
+    ledger = BudgetLedger(
+        Money(currency="USD", amount=Decimal("1")),
+        window_seconds=60,
+        buckets=6,
+        stripes=1,
+        clock=clock,
+    )
+    cost = Money(currency="USD", amount=Decimal("0.1"))
+    ledger.set_limit("tenant-vip", Decimal("5"))
+    ledger.charge("tenant-a", cost)
+    clock.now += 120
+    assert ledger.spent("tenant-a").amount == Decimal("0")
+    assert set(ledger.snapshot()["keys"]) == {"tenant-vip"}
+
+    for index in range(200):
+        ledger.charge(f"tenant-{index}", cost)
+        clock.now += 1
+    assert len(ledger.snapshot()["keys"]) < 200
+    assert ledger.remaining("tenant-vip").amount == Decimal("5")
+
+
+def test_concurrent_charges() -> None:
+    ledger = BudgetLedger(Money(currency="USD", amount=Decimal("1000")), stripes=4)
+    cost = Money(currency="USD", amount=Decimal("0.01"))
+
+    def worker() -> None:
+        for index in range(1_000):
+            ledger.charge(f"tenant-{index % 8}", cost)
+
+    threads = [Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    total = sum(ledger.spent(f"tenant-{index}").amount for index in range(8))
+    assert total == Decimal("80.00")
+
+
+def test_snapshot_round_trip(tmp_path: Path) -> None:
+    clock = _Clock()
+    ledger = BudgetLedger(Money(currency="EUR", amount=Decimal("5")), clock=clock)
+    ledger.set_limit("tenant-a", Decimal("3"))
+    ledger.charge("tenant-a", Money(currency="EUR", amount=Decimal("1.25")))
+    path = tmp_path / "budget.json"
+    ledger.save(path)
+
+    restored = BudgetLedger.load(path, clock=clock)
+    assert restored.spent("tenant-a") == ledger.spent("tenant-a")
+    assert restored.remaining("tenant-a").amount == Decimal("1.75")
@@ -0,0 +1,86 @@
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from llm_price import cli
+from llm_price.compare import PriceIndex, Workload, load_workload, rank_models
+from llm_price.data import get_model_info, list_models
+
+
+def test_rank_models_orders_by_projected_cost() -> None:
+    ranked = rank_models(Workload(prompt_tokens=1_000_000, completion_tokens=250_000))
+    costs = [item.total_cost.amount for item in ranked]
+    assert costs == sorted(costs)
+    assert len(ranked) == len(list_models())
+
+    info = get_model_info("openai", "gpt-4o-mini")
+    expected = info.pricing.input_per_1m + info.pricing.output_per_1m / 4
+    match = next(item for item in ranked if item.info == info)
+    assert match.total_cost.amount == expected
+
+
+def test_rank_models_filters() -> None:
+    workload = Workload(prompt_tokens=2_000_000, completion_tokens=100_000)
+    ranked = rank_models(
+        workload,
+        provider="google",
+        released_after=date(2024, 1, 1),
+        max_cost=Decimal("1"),
+    )
+    assert ranked
+    for item in ranked:
+        assert item.info.provider == "google"
+        assert item.total_cost.amount <= Decimal("1")
+
+    limited = rank_models(workload, limit=3)
+    assert limited == rank_models(workload)[:3]
+
+
+def test_price_index_uses_cached_input_price() -> None:
+    info = get_model_info("openai", "gpt-4o-mini")
+    assert info.pricing.cached_input_per_1m is not None
+    index = PriceIndex([info])
+    [(cost, _)] = index.rank(
+        Workload(prompt_tokens=1_000_000, completion_tokens=0, cached_tokens=1_000_000)
+    )
+    assert cost == info.pricing.cached_input_per_1m
+
+
+def test_load_workload_sums_token_lines(tmp_path: Path) -> None:
+    path = tmp_path / "usage.jsonl"
+    path.write_text(
+        '{"provider":"openai","model":"gpt-4o-mini","prompt_tokens":100,"completion_tokens":5}\n'
+        '{"provider":"openai","model":"gpt-4o","prompt_tokens":20,"cached_tokens":10}\n'
+        '{"total_cost":{"amount":"0.0123","currency":"USD"}}\n',
+        encoding="utf-8",
+    )
+    assert load_workload(path) == Workload(
+        prompt_tokens=120, completion_tokens=5, cached_tokens=10
+    )
+
+
+def test_cli_compare(tmp_path: Path) -> None:
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.app,
+        ["compare", "--prompt-tokens", "1000000", "--provider", "openai", "--limit", "3"],
+    )
+    assert result.exit_code == 0, result.output
+    lines = result.output.splitlines()
+    assert len(lines) == 3
+    assert all(line.startswith("openai:") and "currency=USD" in line for line in lines)
+    costs = [Decimal(line.split("total_cost=")[1].split()[0]) for line in lines]
+    assert costs == sorted(costs)
+
+    workload = tmp_path / "usage.jsonl"
+    workload.write_text('{"prompt_tokens": 1000, "completion_tokens": 10}\n', encoding="utf-8")
+    result = runner.invoke(cli.app, ["compare", "--workload", str(workload), "--limit", "1"])
+    assert result.exit_code == 0, result.output
+
+    result = runner.invoke(
+        cli.app, ["compare", "--workload", str(workload), "--prompt-tokens", "5"]
+    )
+    assert result.exit_code == 2
+    assert "--workload" in result.output
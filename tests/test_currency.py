@@ -0,0 +1,36 @@
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from llm_price import currency
+from llm_price.types import Money
+
+
+class _Response:
+    def __init__(self, payload: dict[str, Any]) -> None:
+        self._payload = payload
+
+    def raise_for_status(self) -> None:
+        return None
+
+    def json(self) -> dict[str, Any]:
+        return self._payload
+
+
+def test_get_fx_snapshot_fetches_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[dict[str, Any]] = []
+
+    def fake_get(url: str, *, params: dict[str, str], timeout: float) -> _Response:
+        calls.append(params)
+        return _Response({"rates": {"EUR": 0.5, "INR": 80}})
+
+    monkeypatch.setattr(currency.requests, "get", fake_get)
+    snapshot = currency.get_fx_snapshot(["INR", "USD", "EUR", "INR"])
+
+    assert calls == [{"base": "USD", "symbols": "EUR,INR"}]
+    assert snapshot.rate("USD", "INR") == Decimal("80")
+    assert snapshot.rate("EUR", "INR") == Decimal("160")
+    assert snapshot.convert(Money(currency="INR", amount=Decimal("80")), "USD").amount == 1
+    with pytest.raises(ValueError):
+        snapshot.rate("USD", "GBP")
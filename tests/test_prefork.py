@@ -0,0 +1,107 @@
+import multiprocessing
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from llm_price import currency, prefork
+from llm_price.compare import Workload, rank_models
+from llm_price.data import get_model_info
+from llm_price.shared_prices import SharedPriceTable, use_shared_prices
+from llm_price.types import TokenPrice
+
+
+def _read_price(queue: Any) -> None:
+    queue.put(str(get_model_info("openai", "gpt-4o-mini").pricing.input_per_1m))
+
+
+def test_shared_price_table_is_seen_by_forked_workers() -> None:
+    original = get_model_info("openai", "gpt-4o-mini").pricing
+    table = SharedPriceTable.create()
+    try:
+        use_shared_prices(table)
+        assert get_model_info("openai", "gpt-4o-mini").pricing == original
+
+        context = multiprocessing.get_context("fork")
+        queue = context.Queue()
+        table.update(
+            "openai",
+            "gpt-4o-mini",
+            TokenPrice(
+                input_per_1m=Decimal("0.1"),
+                cached_input_per_1m=None,
+                output_per_1m=Decimal("0.4"),
+            ),
+        )
+        worker = context.Process(target=_read_price, args=(queue,))
+        worker.start()
+        worker.join()
+        assert queue.get(timeout=5) == "0.1"
+
+        attached = SharedPriceTable.attach(table.name)
+        assert attached.pricing(0) == table.pricing(0)
+        attached.close()
+    finally:
+        use_shared_prices(None)
+        table.close()
+        table.unlink()
+    assert get_model_info("openai", "gpt-4o-mini").pricing == original
+
+
+def test_rank_models_follows_shared_price_updates(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(prefork.tiktoken, "get_encoding", lambda name: None)
+    workload = Workload(prompt_tokens=1_000_000, completion_tokens=0)
+    state = prefork.warmup(["gpt-4o-mini"], shared_prices=True, freeze=False)
+    table = state.shared_prices
+    assert table is not None
+    try:
+        table.update(
+            "openai",
+            "gpt-4o-mini",
+            TokenPrice(
+                input_per_1m=Decimal("100"),
+                cached_input_per_1m=None,
+                output_per_1m=Decimal("100"),
+            ),
+        )
+        ranked = {
+            item.info.model: item for item in rank_models(workload, provider="openai")
+        }
+        assert ranked["gpt-4o-mini"].total_cost.amount == Decimal("100")
+        assert ranked["gpt-4o-mini"].info.pricing.input_per_1m == Decimal("100")
+        assert ranked["gpt-4o-mini"].info == get_model_info("openai", "gpt-4o-mini")
+    finally:
+        use_shared_prices(None)
+        table.close()
+        table.unlink()
+    ranked = {item.info.model: item for item in rank_models(workload, provider="openai")}
+    assert ranked["gpt-4o-mini"].info == get_model_info("openai", "gpt-4o-mini")
+
+
+def test_warmup_resolves_encoders_and_primes_fx(monkeypatch: pytest.MonkeyPatch) -> None:
+    loaded: list[str] = []
+    fetches: list[dict[str, str]] = []
+
+    class Response:
+        def raise_for_status(self) -> None:
+            return None
+
+        def json(self) -> dict[str, Any]:
+            return {"rates": {"EUR": 0.5, "INR": 80}}
+
+    def fake_get(url: str, *, params: dict[str, str], timeout: float) -> Response:
+        fetches.append(params)
+        return Response()
+
+    monkeypatch.setattr(prefork.tiktoken, "get_encoding", loaded.append)
+    monkeypatch.setattr(currency.requests, "get", fake_get)
+    monkeypatch.setattr(currency, "_FX_CACHE", {})
+
+    state = prefork.warmup(["gpt-4o-mini"], currencies=["INR", "EUR"], freeze=False)
+
+    assert state.encodings == ("cl100k_base", "o200k_base")
+    assert loaded == ["cl100k_base", "o200k_base"]
+    assert state.shared_prices is None
+    assert currency.get_fx_rate("USD", "INR") == Decimal("80")
+    assert currency.get_fx_rate("USD", "EUR") == Decimal("0.5")
+    assert len(fetches) == 1
@@ -1,6 +1,15 @@
+import json
 from decimal import Decimal
+from pathlib import Path
+from typing import Any
 
-from llm_price.pricing import cost_from_tokens, sum_cost
+import pytest
+from typer.testing import CliRunner
+
+from llm_price import cli, currency
+from llm_price.currency import FxSnapshot
+from llm_price.pricing import cost_from_tokens, sum_cost, summarize_costs
+from llm_price.types import Money
 
 
 def test_cost_from_tokens_usd() -> None:
@@ -41,4 +50,61 @@ def test_sum_cost() -> None:
         completion_tokens=1_000_000,
     )
     total = sum_cost([first, second])
-    assert total.amount == Decimal("0.75")
\ No newline at end of file
+    assert total.amount == Decimal("0.75")
+
+
+def test_sum_cost_mixed_currencies() -> None:
+    fx = FxSnapshot(
+        base_currency="USD",
+        rates={"INR": Decimal("80"), "EUR": Decimal("0.5")},
+        fetched_at=0.0,
+    )
+    records = [
+        {"total_cost": Money(currency="USD", amount=Decimal("1"))},
+        {"total_cost": Money(currency="INR", amount=Decimal("40"))},
+        {"total_cost": Money(currency="INR", amount=Decimal("120"))},
+        {"total_cost": Money(currency="EUR", amount=Decimal("2"))},
+    ]
+    summary = summarize_costs(records, currency="EUR", fx=fx)
+    assert summary.total == Money(currency="EUR", amount=Decimal("3.5"))
+    assert summary.subtotals["INR"].amount == Decimal("160")
+    assert sum_cost(records, currency="USD", fx=fx).amount == Decimal("7")
+    with pytest.raises(ValueError):
+        sum_cost(records)
+
+
+def test_cli_sum_skips_fx_without_conversion(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def offline_get(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("sum must not fetch FX rates when nothing is converted")
+
+    monkeypatch.setattr(currency.requests, "get", offline_get)
+    usage = tmp_path / "usage.jsonl"
+    usage.write_text(
+        '{"total_cost": {"amount": "10", "currency": "INR"}}\n'
+        '{"total_cost": {"amount": "5", "currency": "INR"}}\n'
+        '{"provider": "openai", "model": "gpt-4o-mini", "prompt_tokens": 0, '
+        '"completion_tokens": 0, "currency": "INR", "fx_rate": "80"}\n',
+        encoding="utf-8",
+    )
+    result = CliRunner().invoke(cli.app, ["sum", str(usage)])
+    assert result.exit_code == 0, result.output
+    assert Decimal(json.loads(result.output)["total"]) == Decimal("15")
+
+    result = CliRunner().invoke(cli.app, ["sum", str(usage), "--currency", "INR"])
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output)["currency"] == "INR"
+
+
+def test_cli_sum_mixed_currencies_needs_currency(tmp_path: Path) -> None:
+    usage = tmp_path / "usage.jsonl"
+    usage.write_text(
+        '{"total_cost": {"amount": "10", "currency": "INR"}}\n'
+        '{"total_cost": {"amount": "1", "currency": "USD"}}\n',
+        encoding="utf-8",
+    )
+    result = CliRunner().invoke(cli.app, ["sum", str(usage)])
+    assert result.exit_code == 2
+    assert "--currency" in result.output
+    assert not isinstance(result.exception, ValueError)
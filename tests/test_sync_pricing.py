@@ -0,0 +1,173 @@
+import json
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+from sync_pricing import Source, catalogue_parser, parse_openai_pricing, sync
+
+_CATALOGUE = [
+    {
+        "provider": "openai",
+        "model": "gpt-4o-mini",
+        "release_date": "2024-07-18",
+        "pricing": {"input_per_1m": "0.15", "cached_input_per_1m": None, "output_per_1m": "0.6"},
+        "notes": "OpenAI pricing in USD per 1M tokens",
+    },
+    {
+        "provider": "google",
+        "model": "gemini-1.5-flash",
+        "release_date": "2024-05-14",
+        "pricing": {"input_per_1m": "0.35", "cached_input_per_1m": None, "output_per_1m": "1.05"},
+        "notes": "Google pricing in USD per 1M tokens",
+    },
+]
+
+
+class _FixtureServer:
+    """Serves JSON bodies by path with an ETag, answering 304 when it matches."""
+
+    def __init__(self) -> None:
+        self.bodies: dict[str, object] = {}
+        self.requests: list[tuple[str, int]] = []
+        fixture = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802
+                body = json.dumps(fixture.bodies[self.path]).encode()
+                etag = f'"{hash(body)}"'
+                if self.headers.get("If-None-Match") == etag:
+                    fixture.requests.append((self.path, 304))
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                fixture.requests.append((self.path, 200))
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args: object) -> None:
+                return None
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+
+@pytest.fixture
+def fixture_server() -> Iterator[_FixtureServer]:
+    fixture = _FixtureServer()
+    thread = threading.Thread(target=fixture.server.serve_forever, daemon=True)
+    thread.start()
+    yield fixture
+    fixture.server.shutdown()
+    fixture.server.server_close()
+
+
+def _sources(fixture: _FixtureServer) -> list[Source]:
+    return [
+        Source("openai", f"{fixture.url}/openai.json", parse_openai_pricing),
+        Source("google", f"{fixture.url}/google.json", catalogue_parser("google")),
+    ]
+
+
+def test_sync_updates_and_reports(fixture_server: _FixtureServer, tmp_path: Path) -> None:
+    models_path = tmp_path / "models.json"
+    state_path = tmp_path / "state.json"
+    models_path.write_text(json.dumps(_CATALOGUE, indent=2) + "\n", encoding="utf-8")
+    fixture_server.bodies["/openai.json"] = {
+        "a": {"model": "gpt-4o-mini", "pricing_type": "per_1m_tokens", "input": 0.15,
+              "cached_input": 0.075, "output": 0.6},
+        "b": {"model": "gpt-5-nano", "pricing_type": "per_1m_tokens", "input": 0.05,
+              "output": 0.4},
+        "c": {"model": "dall-e-3", "pricing_type": "per_image"},
+    }
+    fixture_server.bodies["/google.json"] = [
+        {**_CATALOGUE[1], "pricing": {**_CATALOGUE[1]["pricing"], "output_per_1m": "1.20"}}
+    ]
+
+    report = sync(_sources(fixture_server), models_path=models_path, state_path=state_path)
+
+    assert report["written"] is True
+    assert report["changes"]["added"] == [{"provider": "openai", "model": "gpt-5-nano"}]
+    assert report["changes"]["removed"] == []
+    changed = {item["model"]: item["fields"] for item in report["changes"]["changed"]}
+    assert changed == {
+        "gpt-4o-mini": {"pricing.cached_input_per_1m": [None, "0.075"]},
+        "gemini-1.5-flash": {"pricing.output_per_1m": ["1.05", "1.2"]},
+    }
+    models = json.loads(models_path.read_text(encoding="utf-8"))
+    mini = next(item for item in models if item["model"] == "gpt-4o-mini")
+    assert mini["release_date"] == "2024-07-18"
+    assert mini["notes"] == "OpenAI pricing in USD per 1M tokens"
+
+
+def test_sync_skips_unchanged_sources(fixture_server: _FixtureServer, tmp_path: Path) -> None:
+    models_path = tmp_path / "models.json"
+    state_path = tmp_path / "state.json"
+    models_path.write_text(json.dumps(_CATALOGUE, indent=2) + "\n", encoding="utf-8")
+    fixture_server.bodies["/openai.json"] = {
+        "a": {"model": "gpt-4o-mini", "pricing_type": "per_1m_tokens", "input": "0.150",
+              "output": 0.6},
+    }
+    fixture_server.bodies["/google.json"] = [_CATALOGUE[1]]
+    before = models_path.stat().st_mtime_ns
+
+    first = sync(_sources(fixture_server), models_path=models_path, state_path=state_path)
+    second = sync(_sources(fixture_server), models_path=models_path, state_path=state_path)
+
+    assert first["written"] is False
+    assert second["written"] is False
+    assert models_path.stat().st_mtime_ns == before
+    assert {item["status"] for item in second["sources"].values()} == {"not_modified"}
+    assert sorted(status for _, status in fixture_server.requests) == [200, 200, 304, 304]
+
+
+def test_sync_reports_source_errors(fixture_server: _FixtureServer, tmp_path: Path) -> None:
+    models_path = tmp_path / "models.json"
+    models_path.write_text(json.dumps(_CATALOGUE, indent=2) + "\n", encoding="utf-8")
+    fixture_server.bodies["/openai.json"] = ["not", "an", "object"]
+    fixture_server.bodies["/google.json"] = [_CATALOGUE[1]]
+
+    report = sync(
+        _sources(fixture_server), models_path=models_path, state_path=tmp_path / "state.json"
+    )
+
+    assert report["sources"]["openai"]["status"] == "error"
+    assert report["sources"]["google"]["status"] == "fetched"
+    assert report["written"] is False
+
+
+def test_sync_keeps_provider_when_feed_is_empty(
+    fixture_server: _FixtureServer, tmp_path: Path
+) -> None:
+    models_path = tmp_path / "models.json"
+    models_path.write_text(json.dumps(_CATALOGUE, indent=2) + "\n", encoding="utf-8")
+    fixture_server.bodies["/openai.json"] = {
+        "a": {"model": "gpt-4o-mini", "pricing_type": "per_1k_tokens", "input": 0.00015},
+    }
+    fixture_server.bodies["/google.json"] = [
+        {**_CATALOGUE[1], "release_date": "2024-05-15", "notes": "Updated Gemini notes"}
+    ]
+
+    report = sync(
+        _sources(fixture_server), models_path=models_path, state_path=tmp_path / "state.json"
+    )
+
+    assert report["sources"]["openai"]["status"] == "error"
+    assert report["changes"]["removed"] == []
+    assert report["changes"]["changed"] == [
+        {
+            "provider": "google",
+            "model": "gemini-1.5-flash",
+            "fields": {
+                "release_date": ["2024-05-14", "2024-05-15"],
+                "notes": ["Google pricing in USD per 1M tokens", "Updated Gemini notes"],
+            },
+        }
+    ]
+    models = json.loads(models_path.read_text(encoding="utf-8"))
+    assert [item["model"] for item in models] == ["gpt-4o-mini", "gemini-1.5-flash"]
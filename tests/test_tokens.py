@@ -0,0 +1,143 @@
+import io
+import unicodedata
+from decimal import Decimal
+
+import pytest
+import tiktoken
+
+from llm_price.pricing import cost_from_text
+from llm_price.tokens import (
+    _load_calibrations,
+    _safe_chunks,
+    count_tokens_stream,
+    estimate_tokens,
+)
+
+_CL100K_PATTERN = (
+    r"""'(?i:[sdmt]|ll|ve|re)|[^\r\n\p{L}\p{N}]?+\p{L}++|\p{N}{1,3}+|"""
+    r""" ?[^\s\p{L}\p{N}]++[\r\n]*+|\s++$|\s*[\r\n]|\s+(?!\S)|\s"""
+)
+_O200K_PATTERN = "|".join(
+    [
+        r"""[^\r\n\p{L}\p{N}]?[\p{Lu}\p{Lt}\p{Lm}\p{Lo}\p{M}]*[\p{Ll}\p{Lm}\p{Lo}\p{M}]+"""
+        r"""(?i:'s|'t|'re|'ve|'m|'ll|'d)?""",
+        r"""[^\r\n\p{L}\p{N}]?[\p{Lu}\p{Lt}\p{Lm}\p{Lo}\p{M}]+[\p{Ll}\p{Lm}\p{Lo}\p{M}]*"""
+        r"""(?i:'s|'t|'re|'ve|'m|'ll|'d)?""",
+        r"""\p{N}{1,3}""",
+        r""" ?[^\s\p{L}\p{N}]+[\r\n/]*""",
+        r"""\s*[\r\n]+""",
+        r"""\s+(?!\S)""",
+        r"""\s+""",
+    ]
+)
+_WORDS = [" the", " quick", " brown", " fox", "\n\n", "ing", " 1234"]
+
+
+def _test_encoding(
+    pattern: str = _CL100K_PATTERN, words: list[str] = _WORDS
+) -> tiktoken.Encoding:
+    ranks = {bytes([value]): value for value in range(256)}
+    for word in words:
+        data = word.encode()
+        for end in range(2, len(data) + 1):
+            ranks.setdefault(data[:end], len(ranks))
+    return tiktoken.Encoding(
+        name="llm-price-test", pat_str=pattern, mergeable_ranks=ranks, special_tokens={}
+    )
+
+
+_TEXT = (
+    "The quick brown fox jumps over the lazy dog.\n"
+    "  indented line with   runs of spaces\n\n"
+    "numbers 1234567 and punctuation!?\r\nwindows line\n"
+    "unicode: naïve café — ünïcödé\n"
+) * 200
+
+
+def test_stream_matches_one_shot() -> None:
+    encoding = _test_encoding()
+    expected = len(encoding.encode(_TEXT))
+    for chunk_chars in (16, 97, 1024):
+        assert count_tokens_stream(_TEXT, encoding=encoding, chunk_chars=chunk_chars) == expected
+
+
+def test_stream_accepts_files_and_iterables() -> None:
+    encoding = _test_encoding()
+    expected = len(encoding.encode(_TEXT))
+    assert (
+        count_tokens_stream(io.StringIO(_TEXT), encoding=encoding, chunk_chars=64, max_workers=1)
+        == expected
+    )
+    pieces = (_TEXT[start : start + 7] for start in range(0, len(_TEXT), 7))
+    assert count_tokens_stream(pieces, encoding=encoding, chunk_chars=64) == expected
+
+
+def test_stream_bounds_chunks_without_whitespace() -> None:
+    encoding = _test_encoding()
+    texts = [
+        "".join(chr(0x4E00 + (index * 7919) % 20_000) for index in range(5_000)),
+        '{"id":1,"name":"item","tags":["a","bb"],"v":0.25}' * 100,
+    ]
+    for text in texts:
+        forced_cuts = [0]
+        chunks = list(_safe_chunks(iter([text]), 64, forced_cuts))
+        assert "".join(chunks) == text
+        assert max(len(chunk) for chunk in chunks) <= 4 * 64
+        assert forced_cuts[0] > 0
+        expected = len(encoding.encode(text))
+        counted = count_tokens_stream(text, encoding=encoding, chunk_chars=64)
+        assert abs(counted - expected) <= 2 * forced_cuts[0]
+
+
+def test_forced_cuts_keep_marks_with_their_letters() -> None:
+    # Decomposed é (e + U+0301) and Thai vowel signs, which combining() reports as 0.
+    decomposed = "xe\u03011," * 400
+    thai = "กั้นน้ำมีที่ดินสำหรับเด็ก" * 100
+    assert unicodedata.combining("\u0e31") == 0
+    encoding = _test_encoding(_O200K_PATTERN, ["xe\u0301", "กั้", "น้ำ", "ที่"])
+    for text in (decomposed, thai):
+        for chunk_chars in (16, 17, 18, 19):
+            forced_cuts = [0]
+            chunks = list(_safe_chunks(iter([text]), chunk_chars, forced_cuts))
+            assert forced_cuts[0] > 0
+            assert not any(unicodedata.category(chunk[0]).startswith("M") for chunk in chunks)
+    expected = len(encoding.encode(decomposed))
+    for chunk_chars in (16, 17, 18, 19):
+        assert count_tokens_stream(decomposed, encoding=encoding, chunk_chars=chunk_chars) == (
+            expected
+        )
+
+
+# Exact o200k_base count for _PROSE, as used by gpt-4o-mini.
+_PROSE = (
+    "Pricing data is stored in models.json in USD per 1M tokens. OpenAI pricing is refreshed "
+    "daily via a GitHub Actions workflow, and entries also store cached input prices when "
+    "available. For non-USD output, FX defaults to a real-time rate from exchangerate.host.\n"
+) * 3
+_PROSE_O200K_TOKENS = 168
+
+
+def test_fast_estimate_within_calibrated_bound() -> None:
+    usage, note = estimate_tokens("openai", "gpt-4o-mini", prompt=_PROSE, estimate_mode="fast")
+    calibration = _load_calibrations()["o200k_base"]
+    error = abs(usage.prompt_tokens - _PROSE_O200K_TOKENS) / _PROSE_O200K_TOKENS
+    assert error <= calibration.p95_abs_error
+    assert usage.completion_tokens == 0
+    assert note is not None and "o200k_base" in note
+
+
+def test_fast_mode_in_cost_from_text() -> None:
+    breakdown = cost_from_text(
+        "google",
+        "gemini-1.5-flash",
+        prompt=_PROSE,
+        completion="Short answer.",
+        currency="INR",
+        fx_rate=Decimal("80"),
+        estimate_mode="fast",
+    )
+    assert breakdown.usage.prompt_tokens > 0
+    assert breakdown.usage.completion_tokens > 0
+    assert breakdown.notes is not None and breakdown.notes.startswith("Fast token estimate")
+    with pytest.raises(ValueError):
+        estimate_tokens("openai", "gpt-4o", prompt="hi", estimate_mode="slow")  # type: ignore[arg-type]